@@ -1,61 +1,104 @@
 """Generator for assemblers."""
 
-from jinja2 import Environment, FileSystemLoader
+from jinja2 import Environment
 from pathlib import Path
 from typing import Dict, List, Tuple
 from ..model.isa_model import ISASpecification, Instruction
+from .environment import create_environment
 
 # Template is now loaded from file: isa_dsl/generators/templates/assembler.j2
 # Template is now loaded from file: isa_dsl/generators/templates/assembler.j2
 
 
 
+def _configure_environment(env: Environment) -> None:
+    """Add the assembler template filters to the shared environment."""
+    # Mask filter handling negative width (msb/lsb swapped) by using absolute value
+    def mask_filter(width):
+        if width is None:
+            return 0
+        width = abs(width)
+        if width <= 0:
+            return 0
+        return (1 << width) - 1
+    
+    env.filters['mask'] = mask_filter
+
+
 class AssemblerGenerator:
     """Generates assemblers from ISA specifications."""
 
     def __init__(self, isa: ISASpecification):
         self.isa = isa
 
-    def generate(self, output_path: str):
-        """Generate the assembler code."""
-        # Get templates directory
-        templates_dir = Path(__file__).parent / 'templates'
-        
-        # Create environment with FileSystemLoader
-        env = Environment(
-            loader=FileSystemLoader(str(templates_dir)),
-            trim_blocks=False,
-            lstrip_blocks=False
-        )
-        
-        # Add custom filter for computing bit masks
-        def mask_filter(width):
-            if width is None:
-                return 0
-            # Handle negative width (msb/lsb swapped) by using absolute value
-            width = abs(width)
-            if width <= 0:
-                return 0
-            return (1 << width) - 1
-        
-        # Add filter for computing slot masks (for bundles)
-        def slot_mask_filter(slot):
-            if slot is None:
-                return 0
-            width = slot.width()
-            if width <= 0:
-                return 0
-            return (1 << width) - 1
-        
-        env.filters['mask'] = mask_filter
-        env.filters['slot_mask'] = slot_mask_filter
-        
-        # Add enumerate to globals
-        env.globals['enumerate'] = enumerate
+    def _build_width_table(self) -> Dict[str, int]:
+        """Map each non-bundle mnemonic to its instruction width in bytes.
+
+        The first declaration of a mnemonic wins, as with the sequential
+        checks the table replaces.
+        """
+        widths: Dict[str, int] = {}
+        for instr in self.isa.instructions:
+            if instr.is_bundle():
+                continue
+            if instr.format:
+                width = (instr.format.width + 7) // 8
+            elif instr.bundle_format:
+                width = (instr.bundle_format.width + 7) // 8
+            else:
+                width = 4
+            widths.setdefault(instr.mnemonic.upper(), width)
+        return widths
+
+    def _build_word_width_table(self, instruction_widths: Dict[str, int]) -> Dict[str, int]:
+        """Map the leading word of an assembly line to its width in bytes, where the word decides it.
+
+        A line is sized by the assembly_syntax it matches, or else by its
+        leading word as a mnemonic. A word is only included if every line
+        starting with it gets the same width: every assembly_syntax whose
+        leading word is a prefix of it must resolve to that width, as must the
+        lines that match none. Other lines are matched against the syntaxes.
+        """
+        syntaxes = [(instr.assembly_syntax, instr.mnemonic.upper())
+                    for instr in self.isa.instructions
+                    if instr.assembly_syntax and not instr.is_bundle()]
+        syntaxes += [(alias.assembly_syntax, alias.target_mnemonic.upper())
+                     for alias in self.isa.instruction_aliases if alias.assembly_syntax]
+
+        candidates: Dict[str, set] = {}
+        syntax_words: List[Tuple[str, str]] = []
+        for syntax, mnemonic in syntaxes:
+            words = syntax.split()
+            if not words or '{' in words[0]:
+                # Lines with any leading word may match this syntax
+                return {}
+            word = words[0].upper()
+            candidates.setdefault(word, set())
+            syntax_words.append((word, mnemonic))
+        for mnemonic in instruction_widths:
+            candidates.setdefault(mnemonic, set())
+
+        for word, widths in candidates.items():
+            # Lines matching no syntax fall back to the mnemonic table
+            widths.add(instruction_widths.get(word, 4))
+            for syntax_word, mnemonic in syntax_words:
+                if word.startswith(syntax_word):
+                    widths.add(instruction_widths.get(mnemonic, instruction_widths.get(word, 4)))
+        return {word: widths.pop() for word, widths in candidates.items() if len(widths) == 1}
+
+    def render(self) -> str:
+        """Render the assembler source code."""
+        env = create_environment(_configure_environment)
         
         # Load template from file
         template = env.get_template('assembler.j2')
-        code = template.render(isa=self.isa)
+        instruction_widths = self._build_width_table()
+        return template.render(isa=self.isa, instruction_widths=instruction_widths,
+                               word_widths=self._build_word_width_table(instruction_widths))
+
+    def generate(self, output_path: str):
+        """Generate the assembler code."""
+        code = self.render()
         
         output_file = Path(output_path) / 'assembler.py'
         output_file.parent.mkdir(parents=True, exist_ok=True)
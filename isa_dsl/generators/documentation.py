@@ -3,6 +3,7 @@
 from jinja2 import Environment, FileSystemLoader, Template
 from pathlib import Path
 from ..model.isa_model import ISASpecification
+from .environment import create_environment
 
 # Template is now loaded from file: isa_dsl/generators/templates/documentation.j2
 # Template is now loaded from file: isa_dsl/generators/templates/documentation.j2
@@ -90,15 +91,7 @@ class DocumentationGenerator:
 
     def generate(self, output_path: str, format: str = 'markdown'):
         """Generate documentation."""
-        # Get templates directory
-        templates_dir = Path(__file__).parent / 'templates'
-        
-        # Create environment with FileSystemLoader
-        env = Environment(
-            loader=FileSystemLoader(str(templates_dir)),
-            trim_blocks=False,
-            lstrip_blocks=False
-        )
+        env = create_environment()
         
         def format_rtl_statement(stmt):
             return self._format_rtl_statement(stmt)
@@ -0,0 +1,54 @@
+"""Jinja2 environment shared by the code generators."""
+
+from functools import lru_cache
+from jinja2 import Environment, FileSystemLoader
+from pathlib import Path
+from typing import Callable, Optional
+
+
+def mask_filter(width):
+    """Return the bit mask for a field width (0 for no or negative width)."""
+    if width is None or width < 0:
+        return 0
+    return (1 << width) - 1
+
+
+def slot_mask_filter(slot):
+    """Return the bit mask for a bundle slot."""
+    if slot is None:
+        return 0
+    width = slot.width()
+    if width <= 0:
+        return 0
+    return (1 << width) - 1
+
+
+@lru_cache(maxsize=None)
+def create_environment(configure: Optional[Callable[[Environment], None]] = None) -> Environment:
+    """Create the Jinja2 environment for the generator templates.
+
+    configure, if given, adds generator-specific filters and globals. One
+    environment is built per configure function and reused, so compiled
+    templates are shared between generator runs; compiling the templates
+    dominates generation time.
+    """
+    # Get templates directory
+    templates_dir = Path(__file__).parent / 'templates'
+
+    # Create environment with FileSystemLoader
+    env = Environment(
+        loader=FileSystemLoader(str(templates_dir)),
+        trim_blocks=False,
+        lstrip_blocks=False
+    )
+
+    # Filters for computing bit masks
+    env.filters['mask'] = mask_filter
+    env.filters['slot_mask'] = slot_mask_filter
+
+    # Add enumerate to globals
+    env.globals['enumerate'] = enumerate
+
+    if configure is not None:
+        configure(env)
+    return env
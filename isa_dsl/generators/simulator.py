@@ -1,9 +1,9 @@
 """Generator for Python-based instruction simulators."""
 
-from jinja2 import Environment, FileSystemLoader
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional, Tuple
 from ..model.isa_model import ISASpecification
+from .environment import create_environment
 
 # Template is now loaded from file: isa_dsl/generators/templates/simulator.j2
 
@@ -318,40 +318,137 @@ class SimulatorGenerator:
             return expr
         return "0"
 
-    def generate(self, output_path: str):
-        """Generate the simulator code."""
-        from jinja2 import Environment, FileSystemLoader
-        
-        # Get templates directory
-        templates_dir = Path(__file__).parent / 'templates'
-        
-        # Create environment with FileSystemLoader
-        env = Environment(
-            loader=FileSystemLoader(str(templates_dir)),
-            trim_blocks=False,
-            lstrip_blocks=False
-        )
-        
-        # Add custom filter for computing bit masks
-        def mask_filter(width):
-            if width is None or width < 0:
-                return 0
-            return (1 << width) - 1
-        
-        # Add filter for computing slot masks (for bundles)
-        def slot_mask_filter(slot):
-            if slot is None:
-                return 0
-            width = slot.width()
-            if width <= 0:
-                return 0
-            return (1 << width) - 1
-        
-        env.filters['mask'] = mask_filter
-        env.filters['slot_mask'] = slot_mask_filter
-        
-        # Add enumerate to globals
-        env.globals['enumerate'] = enumerate
+    def _identification_pattern(self, instr) -> Optional[Tuple[int, int]]:
+        """Return the (mask, match) pair checked by an instruction's _matches_ method.
+
+        Returns None if no instruction word can match (no format, a value that
+        does not fit its field, or conflicting values for the same bits).
+        """
+        fmt = instr.format
+        if not fmt:
+            return None
+        checks = [(field, field.constant_value) for field in fmt.fields if field.has_constant()]
+        if instr.encoding:
+            # A bundle with identification fields is matched on its format
+            # constants alone, like its generated _matches_ method
+            if not (instr.is_bundle() and fmt.get_identification_fields()):
+                for assignment in instr.encoding.assignments:
+                    field = fmt.get_field(assignment.field)
+                    if field:
+                        checks.append((field, assignment.value))
+        elif instr.is_bundle():
+            return None
+
+        mask = 0
+        match = 0
+        for field, value in checks:
+            # Like the mask filter: a field with no bits only holds 0
+            width = field.width()
+            field_mask = (1 << width) - 1 if width > 0 else 0
+            if not isinstance(value, int) or value < 0 or value > field_mask:
+                return None
+            field_mask <<= field.lsb
+            value <<= field.lsb
+            if (match ^ value) & mask & field_mask:
+                return None
+            mask |= field_mask
+            match |= value
+        return mask, match
+
+    def _build_decode_table(self) -> Dict[int, List[Tuple[int, Dict[int, Tuple[int, str]]]]]:
+        """Group instruction identification patterns by format width and mask.
+
+        Each width maps to a list of (mask, {match: (priority, mnemonic)})
+        groups, so step() identifies an instruction with one dict lookup per
+        distinct mask instead of calling every _matches_ method. Priority is
+        the declaration order, which decides between patterns from different
+        groups that match the same word, as the sequential checks did.
+        """
+        decode_table: Dict[int, List[Tuple[int, Dict[int, Tuple[int, str]]]]] = {}
+        for priority, instr in enumerate(self.isa.instructions):
+            widths = []
+            if instr.format:
+                widths.append(instr.format.width)
+            if instr.bundle_format and instr.bundle_format.width not in widths:
+                widths.append(instr.bundle_format.width)
+            pattern = self._identification_pattern(instr)
+            if pattern is None:
+                continue
+            mask, match = pattern
+            for width in widths:
+                groups = decode_table.setdefault(width, [])
+                for group_mask, entries in groups:
+                    if group_mask == mask:
+                        entries.setdefault(match, (priority, instr.mnemonic))
+                        break
+                else:
+                    groups.append((mask, {match: (priority, instr.mnemonic)}))
+        return decode_table
+
+    def _build_peek_bits(self) -> Dict[int, int]:
+        """Map each format width, shortest first, to the bits step() loads to identify it."""
+        peek_bits: Dict[int, int] = {}
+        for instr in self.isa.instructions:
+            if instr.format:
+                width = instr.format.width
+                min_bits = instr.format.get_minimum_bits_for_identification()
+                peek_bits[width] = max(peek_bits.get(width, 0), min_bits)
+            if instr.bundle_format:
+                width = instr.bundle_format.width
+                if instr.format:
+                    min_bits = instr.format.get_minimum_bits_for_identification()
+                else:
+                    min_bits = 32
+                peek_bits[width] = max(peek_bits.get(width, 0), min_bits)
+        return dict(sorted(peek_bits.items()))
+
+    def _build_length_table(self, decode_table, peek_bits: Dict[int, int]) -> List[Tuple[int, ...]]:
+        """For every value of an instruction's first byte, list the widths it can decode as.
+
+        A width is listed if at least one of its identification patterns agrees
+        with the byte on the bits the pattern checks there. Widths keep the
+        shortest-first order of peek_bits.
+        """
+        length_table = []
+        for first_byte in range(256):
+            widths = []
+            for width, min_bits in peek_bits.items():
+                # Bits above min_bits are never loaded, so step() sees them as zero
+                byte = first_byte & ((1 << min(min_bits, 8)) - 1)
+                if any(((byte ^ match) & mask & 0xFF) == 0
+                       for mask, entries in decode_table.get(width, ())
+                       for match in entries):
+                    widths.append(width)
+            length_table.append(tuple(widths))
+        return length_table
+
+    def _build_handler_table(self) -> Dict[str, str]:
+        """Map every instruction and alias mnemonic to the instruction it executes.
+
+        Aliases are resolved the way the generated simulator resolved them at
+        run time: the first alias with a mnemonic wins over an instruction of
+        the same name, and aliases may point at other aliases. Mnemonics that
+        do not resolve to an instruction are left out.
+        """
+        instruction_mnemonics = {instr.mnemonic for instr in self.isa.instructions}
+        alias_targets: Dict[str, str] = {}
+        for alias in self.isa.instruction_aliases:
+            alias_targets.setdefault(alias.alias_mnemonic, alias.target_mnemonic)
+
+        handlers: Dict[str, str] = {}
+        for mnemonic in [instr.mnemonic for instr in self.isa.instructions] + list(alias_targets):
+            target = mnemonic
+            seen = set()
+            while target in alias_targets and target not in seen:
+                seen.add(target)
+                target = alias_targets[target]
+            if target not in seen and target in instruction_mnemonics:
+                handlers.setdefault(mnemonic, target)
+        return handlers
+
+    def render(self) -> str:
+        """Render the simulator source code."""
+        env = create_environment()
         
         # Load template from file
         template = env.get_template('simulator.j2')
@@ -360,7 +457,21 @@ class SimulatorGenerator:
         def generate_rtl_code(stmt, instruction):
             return self._generate_rtl_code(stmt)
         
-        code = template.render(isa=self.isa, generate_rtl_code=generate_rtl_code)
+        decode_table = self._build_decode_table()
+        peek_bits = self._build_peek_bits()
+        return template.render(
+            isa=self.isa,
+            generate_rtl_code=generate_rtl_code,
+            decode_table=decode_table,
+            peek_bits=peek_bits,
+            length_table=self._build_length_table(decode_table, peek_bits),
+            handlers=self._build_handler_table(),
+            match_patterns=[self._identification_pattern(instr) for instr in self.isa.instructions],
+        )
+
+    def generate(self, output_path: str):
+        """Generate the simulator code."""
+        code = self.render()
         
         output_file = Path(output_path) / 'simulator.py'
         output_file.parent.mkdir(parents=True, exist_ok=True)
@@ -4,6 +4,11 @@ from typing import List, Optional, Dict, Any, Tuple
 from dataclasses import dataclass, field
 
 
+# (lsb, mask, offset) for each field holding part of an operand: the operand
+# bits from offset upwards, masked, are stored at lsb
+_FieldParts = Tuple[Tuple[int, int, int], ...]
+
+
 # Base class for textX model objects
 class TextXObject:
     """Base class for textX model objects."""
@@ -245,6 +250,11 @@ class OperandSpec(TextXObject):
         return len(self.field_names) > 0
 
 
+# (format, encoding bits, field parts by operand name, (name, field parts) of
+# each decoded operand); see Instruction._get_codec()
+_Codec = Tuple[InstructionFormat, int, Dict[str, _FieldParts], Tuple[Tuple[str, _FieldParts], ...]]
+
+
 @dataclass
 class Instruction(TextXObject):
     """An instruction definition."""
@@ -257,6 +267,10 @@ class Instruction(TextXObject):
     assembly_syntax: Optional[str] = None  # Format string for disassembly (e.g., "ADD R{rd}, R{rs1}, R{rs2}")
     behavior: Optional['RTLBlock'] = None
     external_behavior: bool = False  # If True, behavior is externally defined and implemented by user
+    # Operand bit layout of the format, built on first use; see _get_codec()
+    _codec: Optional[_Codec] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def is_bundle(self) -> bool:
         """Check if this is a bundle instruction."""
@@ -297,33 +311,11 @@ class Instruction(TextXObject):
             return {}
 
         operands = {}
-        
-        # Use operand_specs if available, otherwise fall back to legacy operands list
-        if self.operand_specs:
-            for operand_spec in self.operand_specs:
-                if operand_spec.is_distributed():
-                    # Combine multiple fields
-                    value = 0
-                    shift = 0
-                    for field_name in operand_spec.field_names:
-                        field = self.format.get_field(field_name)
-                        if field:
-                            field_value = field.extract(instruction_word)
-                            value |= (field_value << shift)
-                            shift += field.width()
-                    operands[operand_spec.name] = value
-                else:
-                    # Simple operand - use operand name as field name
-                    field = self.format.get_field(operand_spec.name)
-                    if field:
-                        operands[operand_spec.name] = field.extract(instruction_word)
-        else:
-            # Legacy: simple operand names
-            for operand_name in self.operands:
-                field = self.format.get_field(operand_name)
-                if field:
-                    operands[operand_name] = field.extract(instruction_word)
-        
+        for operand_name, parts in self._get_codec()[3]:
+            value = 0
+            for lsb, mask, offset in parts:
+                value |= ((instruction_word >> lsb) & mask) << offset
+            operands[operand_name] = value
         return operands
     
     def get_operand_fields(self, operand_name: str) -> List[FormatField]:
@@ -355,32 +347,74 @@ class Instruction(TextXObject):
         if not self.format:
             return 0
 
-        instruction = 0
-
-        # Set encoding fields
-        if self.encoding:
-            for assignment in self.encoding.assignments:
-                field = self.format.get_field(assignment.field)
-                if field:
-                    instruction = field.encode(assignment.value, instruction)
-
-        # Set operand fields
+        _, instruction, operand_parts, _ = self._get_codec()
         for operand_name, value in operand_values.items():
-            fields = self.get_operand_fields(operand_name)
-            if fields:
-                if len(fields) == 1:
-                    # Simple field
-                    instruction = fields[0].encode(value, instruction)
-                else:
-                    # Distributed fields - split value across fields
-                    remaining_value = value
-                    for field in fields:
-                        field_value = remaining_value & ((1 << field.width()) - 1)
-                        instruction = field.encode(field_value, instruction)
-                        remaining_value >>= field.width()
+            # Distributed operands are split across their fields, low bits first
+            for lsb, mask, offset in operand_parts.get(operand_name, ()):
+                instruction = (instruction & ~(mask << lsb)) | (((value >> offset) & mask) << lsb)
 
         return instruction
 
+    def _get_codec(self) -> _Codec:
+        """Get the operand bit layout of the current format, computing it on first use.
+
+        Returns (format, encoding bits, field parts by operand name, decoded
+        operands), the last being the (name, field parts) of each operand
+        decode_operands() returns, in order. Names that are not operands map
+        to the format field of the same name. The format may be re-resolved
+        after construction, so the layout is rebuilt whenever it changes.
+        """
+        codec = self._codec
+        if codec is None or codec[0] is not self.format:
+            fmt = self.format
+            base = 0
+            if self.encoding:
+                for assignment in self.encoding.assignments:
+                    field = fmt.get_field(assignment.field)
+                    if field:
+                        base = field.encode(assignment.value, base)
+
+            operand_parts = {}
+            for field in fmt.fields:
+                operand_parts.setdefault(field.name, self._field_parts([field]))
+            for operand_name in dict.fromkeys(spec.name for spec in self.operand_specs):
+                operand_parts[operand_name] = self._field_parts(self.get_operand_fields(operand_name))
+
+            decoded = []
+            if self.operand_specs:
+                for operand_spec in self.operand_specs:
+                    if operand_spec.is_distributed():
+                        fields = [fmt.get_field(name) for name in operand_spec.field_names]
+                        decoded.append((operand_spec.name, self._field_parts([f for f in fields if f])))
+                    else:
+                        field = fmt.get_field(operand_spec.name)
+                        if field:
+                            decoded.append((operand_spec.name, self._field_parts([field])))
+            else:
+                for operand_name in self.operands:
+                    field = fmt.get_field(operand_name)
+                    if field:
+                        decoded.append((operand_name, self._field_parts([field])))
+
+            codec = (fmt, base, operand_parts, tuple(decoded))
+            self._codec = codec
+        return codec
+
+    @staticmethod
+    def _field_parts(fields: List[FormatField]) -> _FieldParts:
+        """Return the (lsb, mask, offset) parts of an operand stored in fields, low bits first.
+
+        Fields without bits hold no part of the operand and are skipped.
+        """
+        parts = []
+        offset = 0
+        for field in fields:
+            width = field.width()
+            if width > 0:
+                parts.append((field.lsb, (1 << width) - 1, offset))
+                offset += width
+        return tuple(parts)
+
 
 @dataclass
 class RTLBlock(TextXObject):
@@ -25,9 +25,17 @@ class ISAValidator:
     def __init__(self, isa: ISASpecification):
         self.isa = isa
         self.errors: List[ValidationError] = []
+        self._validated = False
 
-    def validate(self) -> List[ValidationError]:
-        """Run all validation checks."""
+    def validate(self, force: bool = False) -> List[ValidationError]:
+        """Run all validation checks.
+
+        The ISA is not modified after parsing, so the result is computed once
+        and returned from cache on later calls. Pass force=True to re-run the
+        checks after changing the ISA.
+        """
+        if self._validated and not force:
+            return self.errors
         self.errors = []
         self._validate_formats()
         self._validate_instructions()
@@ -36,6 +44,7 @@ class ISAValidator:
         self._validate_virtual_registers()
         self._validate_register_aliases()
         self._validate_instruction_aliases()
+        self._validated = True
         return self.errors
 
     def _validate_formats(self):
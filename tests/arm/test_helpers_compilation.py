@@ -1,8 +1,6 @@
 """Compilation and assembly helper methods for ARM Cortex-A9 tests."""
 
 import subprocess
-import sys
-import importlib.util
 from pathlib import Path
 import pytest
 
@@ -10,6 +8,7 @@ from isa_dsl.generators.assembler import AssemblerGenerator
 from isa_dsl.generators.simulator import SimulatorGenerator
 from isa_dsl.generators.disassembler import DisassemblerGenerator
 from tests.arm.test_helpers_basic import ArmTestHelpersBasic
+from tests.tool_cache import load_generated_module
 
 
 class ArmTestHelpersCompilation:
@@ -21,10 +20,7 @@ class ArmTestHelpersCompilation:
         asm_gen = AssemblerGenerator(isa)
         asm_file = asm_gen.generate(tmpdir_path)
         
-        sys.path.insert(0, str(tmpdir_path))
-        asm_spec = importlib.util.spec_from_file_location("assembler", asm_file)
-        asm_module = importlib.util.module_from_spec(asm_spec)
-        asm_spec.loader.exec_module(asm_module)
+        asm_module = load_generated_module(asm_file)
         Assembler = asm_module.Assembler
         assembler = Assembler()
         
@@ -151,7 +147,7 @@ _start:
         machine_code = ArmTestHelpersCompilation.assemble_code(assembler, assembly_code, tmpdir_path)
         
         binary_file = tmpdir_path / "test_arm.bin"
-        assembler.write_binary(machine_code, str(binary_file))
+        assembler.write_binary(machine_code, binary_file)
         assert binary_file.exists() and binary_file.stat().st_size > 0
         
         return assembler, machine_code, binary_file
@@ -186,10 +182,7 @@ _start:
         disasm_gen = DisassemblerGenerator(isa)
         disasm_file = disasm_gen.generate(tmpdir_path)
         
-        sys.path.insert(0, str(tmpdir_path))
-        disasm_spec = importlib.util.spec_from_file_location("disassembler", disasm_file)
-        disasm_module = importlib.util.module_from_spec(disasm_spec)
-        disasm_spec.loader.exec_module(disasm_module)
+        disasm_module = load_generated_module(disasm_file)
         return disasm_module.Disassembler()
     
     @staticmethod
@@ -217,19 +210,12 @@ _start:
     @staticmethod
     def import_all_tools(asm_file, sim_file, disasm_file, tmpdir_path):
         """Import all generated tools. Returns (Assembler, Simulator, Disassembler classes)."""
-        sys.path.insert(0, str(tmpdir_path))
         
-        asm_spec = importlib.util.spec_from_file_location("assembler", asm_file)
-        asm_module = importlib.util.module_from_spec(asm_spec)
-        asm_spec.loader.exec_module(asm_module)
+        asm_module = load_generated_module(asm_file)
         
-        sim_spec = importlib.util.spec_from_file_location("simulator", sim_file)
-        sim_module = importlib.util.module_from_spec(sim_spec)
-        sim_spec.loader.exec_module(sim_module)
+        sim_module = load_generated_module(sim_file)
         
-        disasm_spec = importlib.util.spec_from_file_location("disassembler", disasm_file)
-        disasm_module = importlib.util.module_from_spec(disasm_spec)
-        disasm_spec.loader.exec_module(disasm_module)
+        disasm_module = load_generated_module(disasm_file)
         
         return asm_module.Assembler, sim_module.Simulator, disasm_module.Disassembler
     
@@ -4,6 +4,7 @@ import subprocess
 import sys
 from pathlib import Path
 import pytest
+from tests.tool_cache import load_generated_module
 
 
 class ArmIntegrationTestHelpers:
@@ -163,17 +164,13 @@ _start:
     @staticmethod
     def generate_and_import_assembler(isa, tmpdir_path):
         """Generate assembler from ISA and import it."""
-        import importlib.util
         import sys
         from isa_dsl.generators.assembler import AssemblerGenerator
         
         asm_gen = AssemblerGenerator(isa)
         asm_file = asm_gen.generate(tmpdir_path)
         
-        sys.path.insert(0, str(tmpdir_path))
-        asm_spec = importlib.util.spec_from_file_location("assembler", asm_file)
-        asm_module = importlib.util.module_from_spec(asm_spec)
-        asm_spec.loader.exec_module(asm_module)
+        asm_module = load_generated_module(asm_file)
         Assembler = asm_module.Assembler
         assembler = Assembler()
         
@@ -186,7 +183,7 @@ _start:
         assert len(machine_code) >= 2, "Should assemble at least 2 instructions"
         
         binary_file = tmpdir_path / binary_name
-        assembler.write_binary(machine_code, str(binary_file))
+        assembler.write_binary(machine_code, binary_file)
         assert binary_file.exists() and binary_file.stat().st_size > 0
         
         return machine_code, binary_file
@@ -211,16 +208,13 @@ _start:
     @staticmethod
     def generate_and_import_simulator(isa, tmpdir_path):
         """Generate simulator from ISA and import it."""
-        import importlib.util
         import sys
         from isa_dsl.generators.simulator import SimulatorGenerator
         
         sim_gen = SimulatorGenerator(isa)
         sim_file = sim_gen.generate(tmpdir_path)
         
-        sim_spec = importlib.util.spec_from_file_location("simulator", sim_file)
-        sim_module = importlib.util.module_from_spec(sim_spec)
-        sim_spec.loader.exec_module(sim_module)
+        sim_module = load_generated_module(sim_file)
         Simulator = sim_module.Simulator
         sim = Simulator()
         
@@ -267,17 +261,13 @@ _start:
     @staticmethod
     def generate_and_import_disassembler(isa, tmpdir_path):
         """Generate and import disassembler."""
-        import importlib.util
         import sys
         from isa_dsl.generators.disassembler import DisassemblerGenerator
         
         disasm_gen = DisassemblerGenerator(isa)
         disasm_file = disasm_gen.generate(tmpdir_path)
         
-        sys.path.insert(0, str(tmpdir_path))
-        disasm_spec = importlib.util.spec_from_file_location("disassembler", disasm_file)
-        disasm_module = importlib.util.module_from_spec(disasm_spec)
-        disasm_spec.loader.exec_module(disasm_module)
+        disasm_module = load_generated_module(disasm_file)
         return disasm_module.Disassembler()
     
     @staticmethod
@@ -309,22 +299,11 @@ _start:
     @staticmethod
     def import_all_tools(asm_file, sim_file, disasm_file, tmpdir_path):
         """Import all generated tools."""
-        import importlib.util
-        import sys
-        
-        sys.path.insert(0, str(tmpdir_path))
-        
-        asm_spec = importlib.util.spec_from_file_location("assembler", asm_file)
-        asm_module = importlib.util.module_from_spec(asm_spec)
-        asm_spec.loader.exec_module(asm_module)
+        asm_module = load_generated_module(asm_file)
         
-        sim_spec = importlib.util.spec_from_file_location("simulator", sim_file)
-        sim_module = importlib.util.module_from_spec(sim_spec)
-        sim_spec.loader.exec_module(sim_module)
+        sim_module = load_generated_module(sim_file)
         
-        disasm_spec = importlib.util.spec_from_file_location("disassembler", disasm_file)
-        disasm_module = importlib.util.module_from_spec(disasm_spec)
-        disasm_spec.loader.exec_module(disasm_module)
+        disasm_module = load_generated_module(disasm_file)
         
         return asm_module.Assembler, sim_module.Simulator, disasm_module.Disassembler
     
@@ -1,51 +1,49 @@
 """Tests for assembly syntax feature in disassembler."""
 
 import pytest
-import tempfile
 from pathlib import Path
 
 from isa_dsl.model.parser import parse_isa_file
 from tests.assembly_syntax.test_helpers import AssemblySyntaxTestHelpers
+from tests.tool_cache import load_isa
 
 
-def test_assembly_syntax_formatting():
+def test_assembly_syntax_formatting(tmp_path):
     """Test that disassembler uses assembly_syntax format string when provided."""
     test_data_dir = Path(__file__).parent / "test_data"
-    isa = parse_isa_file(str(test_data_dir / 'comprehensive.isa'))
+    isa = load_isa(test_data_dir / 'comprehensive.isa')
     
     add_instr = AssemblySyntaxTestHelpers.find_instruction_by_mnemonic(isa, 'ADD')
     assert add_instr is not None, "ADD instruction not found"
     assert add_instr.assembly_syntax == "ADD R{rd}, R{rs1}, R{rs2}", "Assembly syntax not parsed correctly"
     
-    with tempfile.TemporaryDirectory() as tmpdir:
-        Assembler, Disassembler = AssemblySyntaxTestHelpers.generate_and_import_tools(isa, tmpdir)
-        asm = Assembler()
-        disasm = Disassembler()
-        
-        result, _ = AssemblySyntaxTestHelpers.test_round_trip(asm, disasm, "ADD R3, R4, R5")
-        assert result == "ADD R3, R4, R5", f"Expected 'ADD R3, R4, R5', got '{result}'"
+    Assembler, Disassembler = AssemblySyntaxTestHelpers.generate_and_import_tools(isa, tmp_path)
+    asm = Assembler()
+    disasm = Disassembler()
+    
+    result, _ = AssemblySyntaxTestHelpers.test_round_trip(asm, disasm, "ADD R3, R4, R5")
+    assert result == "ADD R3, R4, R5", f"Expected 'ADD R3, R4, R5', got '{result}'"
 
 
-def test_assembly_syntax_with_distributed_operands():
+def test_assembly_syntax_with_distributed_operands(tmp_path):
     """Test that assembly_syntax works with distributed operands."""
     test_data_dir = Path(__file__).parent / "test_data"
-    isa = parse_isa_file(str(test_data_dir / 'comprehensive.isa'))
+    isa = load_isa(test_data_dir / 'comprehensive.isa')
     
     add_dist_instr = AssemblySyntaxTestHelpers.find_instruction_by_mnemonic(isa, 'ADD_DIST')
     assert add_dist_instr is not None, "ADD_DIST instruction not found"
     assert add_dist_instr.assembly_syntax == "ADD_DIST R{rd}, R{rs1}, R{rs2}", "Assembly syntax not parsed correctly"
     
-    with tempfile.TemporaryDirectory() as tmpdir:
-        Assembler, Disassembler = AssemblySyntaxTestHelpers.generate_and_import_tools(isa, tmpdir)
-        asm = Assembler()
-        disasm = Disassembler()
-        
-        result, _ = AssemblySyntaxTestHelpers.test_round_trip(asm, disasm, "ADD_DIST R3, R4, R5")
-        assert "ADD_DIST" in result, f"Expected ADD_DIST in result, got '{result}'"
-        assert "R3" in result or "R 3" in result, f"Expected register formatting, got '{result}'"
+    Assembler, Disassembler = AssemblySyntaxTestHelpers.generate_and_import_tools(isa, tmp_path)
+    asm = Assembler()
+    disasm = Disassembler()
+    
+    result, _ = AssemblySyntaxTestHelpers.test_round_trip(asm, disasm, "ADD_DIST R3, R4, R5")
+    assert "ADD_DIST" in result, f"Expected ADD_DIST in result, got '{result}'"
+    assert "R3" in result or "R 3" in result, f"Expected register formatting, got '{result}'"
 
 
-def test_backward_compatibility_no_assembly_syntax():
+def test_backward_compatibility_no_assembly_syntax(tmp_path):
     """Test that instructions without assembly_syntax still work (backward compatibility)."""
     test_isa_content = '''
 architecture TestNoAssemblySyntax {
@@ -82,12 +80,11 @@ architecture TestNoAssemblySyntax {
         assert sub_instr is not None, "SUB instruction not found"
         assert sub_instr.assembly_syntax is None, "SUB should not have assembly_syntax"
         
-        with tempfile.TemporaryDirectory() as tmpdir:
-            Disassembler = AssemblySyntaxTestHelpers.generate_disassembler_only(isa, tmpdir)
-            disasm = Disassembler()
-            instruction_word = 2 << 0
-            result = disasm.disassemble(instruction_word)
-            assert 'SUB' in result, f"Expected 'SUB' in result, got '{result}'"
+        Disassembler = AssemblySyntaxTestHelpers.generate_disassembler_only(isa, tmp_path)
+        disasm = Disassembler()
+        instruction_word = 2 << 0
+        result = disasm.disassemble(instruction_word)
+        assert 'SUB' in result, f"Expected 'SUB' in result, got '{result}'"
     finally:
         Path(test_isa_file).unlink()
 
@@ -1,11 +1,11 @@
 """Helper methods for assembly syntax tests."""
 
 import tempfile
-import importlib.util
 from pathlib import Path
 
 from isa_dsl.generators.disassembler import DisassemblerGenerator
 from isa_dsl.generators.assembler import AssemblerGenerator
+from tests.tool_cache import load_generated_module
 
 
 class AssemblySyntaxTestHelpers:
@@ -23,14 +23,10 @@ class AssemblySyntaxTestHelpers:
         disasm_file = Path(tmpdir_path) / "disassembler.py"
         asm_file = Path(tmpdir_path) / "assembler.py"
         
-        disasm_spec = importlib.util.spec_from_file_location("disassembler", disasm_file)
-        disassembler_module = importlib.util.module_from_spec(disasm_spec)
-        disasm_spec.loader.exec_module(disassembler_module)
+        disassembler_module = load_generated_module(disasm_file)
         Disassembler = disassembler_module.Disassembler
         
-        asm_spec = importlib.util.spec_from_file_location("assembler", asm_file)
-        assembler_module = importlib.util.module_from_spec(asm_spec)
-        asm_spec.loader.exec_module(assembler_module)
+        assembler_module = load_generated_module(asm_file)
         Assembler = assembler_module.Assembler
         
         return Assembler, Disassembler
@@ -62,8 +58,6 @@ class AssemblySyntaxTestHelpers:
         disasm_gen.generate(tmpdir_path)
         
         disasm_file = Path(tmpdir_path) / "disassembler.py"
-        disasm_spec = importlib.util.spec_from_file_location("disassembler", disasm_file)
-        disassembler_module = importlib.util.module_from_spec(disasm_spec)
-        disasm_spec.loader.exec_module(disassembler_module)
+        disassembler_module = load_generated_module(disasm_file)
         return disassembler_module.Disassembler
 
@@ -1,15 +1,13 @@
 """Comprehensive tests for behavior features: temporary variables, hex values, and external behavior."""
 
 import pytest
-import tempfile
-import importlib.util
 from pathlib import Path
-from isa_dsl.model.parser import parse_isa_file
 from isa_dsl.runtime.rtl_interpreter import RTLInterpreter
 from isa_dsl.generators.simulator import SimulatorGenerator
 from isa_dsl.generators.assembler import AssemblerGenerator
 from isa_dsl.generators.disassembler import DisassemblerGenerator
 from isa_dsl.model.isa_model import Variable, RTLConstant, OperandReference
+from tests.tool_cache import load_generated_module, load_isa
 
 
 @pytest.fixture
@@ -22,7 +20,7 @@ def test_data_dir():
 def behavior_features_isa(test_data_dir):
     """Parse the behavior features ISA file."""
     isa_file = test_data_dir / 'behavior_features.isa'
-    return parse_isa_file(str(isa_file))
+    return load_isa(isa_file)
 
 
 # ============================================================================
@@ -114,37 +112,32 @@ def test_temporary_variable_in_conditional(behavior_features_isa):
     assert registers['R'][0] == 0
 
 
-def test_simulator_temporary_variables(behavior_features_isa):
+def test_simulator_temporary_variables(behavior_features_isa, tmp_path):
     """Test generated simulator with temporary variables."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        generator = SimulatorGenerator(behavior_features_isa)
-        sim_file = generator.generate(tmpdir)
-        
-        spec = importlib.util.spec_from_file_location("simulator", sim_file)
-        simulator_module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(simulator_module)
-        Simulator = simulator_module.Simulator
-        
-        sim = Simulator()
-        sim.R[1] = 5
-        sim.R[2] = 3
-        
-        # Assemble ADD_TEMP instruction
-        asm_gen = AssemblerGenerator(behavior_features_isa)
-        asm_file = asm_gen.generate(tmpdir)
-        
-        asm_spec = importlib.util.spec_from_file_location("assembler", asm_file)
-        asm_module = importlib.util.module_from_spec(asm_spec)
-        asm_spec.loader.exec_module(asm_module)
-        Assembler = asm_module.Assembler
-        
-        assembler = Assembler()
-        machine_code = assembler.assemble("ADD_TEMP R0, R1, R2")
-        
-        sim.load_program(machine_code)
-        sim.step()
-        
-        assert sim.R[0] == 8, f"Expected R[0] = 8, got {sim.R[0]}"
+    generator = SimulatorGenerator(behavior_features_isa)
+    sim_file = generator.generate(tmp_path)
+    
+    simulator_module = load_generated_module(sim_file)
+    Simulator = simulator_module.Simulator
+    
+    sim = Simulator()
+    sim.R[1] = 5
+    sim.R[2] = 3
+    
+    # Assemble ADD_TEMP instruction
+    asm_gen = AssemblerGenerator(behavior_features_isa)
+    asm_file = asm_gen.generate(tmp_path)
+    
+    asm_module = load_generated_module(asm_file)
+    Assembler = asm_module.Assembler
+    
+    assembler = Assembler()
+    machine_code = assembler.assemble("ADD_TEMP R0, R1, R2")
+    
+    sim.load_program(machine_code)
+    sim.step()
+    
+    assert sim.R[0] == 8, f"Expected R[0] = 8, got {sim.R[0]}"
 
 
 # ============================================================================
@@ -249,35 +242,30 @@ def test_complex_hex_temp_expression(behavior_features_isa):
     assert registers['R'][0] == 1026, f"Expected R[0] = 1026, got {registers['R'][0]}"
 
 
-def test_simulator_hex_values(behavior_features_isa):
+def test_simulator_hex_values(behavior_features_isa, tmp_path):
     """Test generated simulator with hexadecimal values."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        generator = SimulatorGenerator(behavior_features_isa)
-        sim_file = generator.generate(tmpdir)
-        
-        spec = importlib.util.spec_from_file_location("simulator", sim_file)
-        simulator_module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(simulator_module)
-        Simulator = simulator_module.Simulator
-        
-        sim = Simulator()
-        sim.R[1] = 10
-        
-        asm_gen = AssemblerGenerator(behavior_features_isa)
-        asm_file = asm_gen.generate(tmpdir)
-        
-        asm_spec = importlib.util.spec_from_file_location("assembler", asm_file)
-        asm_module = importlib.util.module_from_spec(asm_spec)
-        asm_spec.loader.exec_module(asm_module)
-        Assembler = asm_module.Assembler
-        
-        assembler = Assembler()
-        machine_code = assembler.assemble("ADD_HEX R0, R1")
-        
-        sim.load_program(machine_code)
-        sim.step()
-        
-        assert sim.R[0] == 26, f"Expected R[0] = 26, got {sim.R[0]}"
+    generator = SimulatorGenerator(behavior_features_isa)
+    sim_file = generator.generate(tmp_path)
+    
+    simulator_module = load_generated_module(sim_file)
+    Simulator = simulator_module.Simulator
+    
+    sim = Simulator()
+    sim.R[1] = 10
+    
+    asm_gen = AssemblerGenerator(behavior_features_isa)
+    asm_file = asm_gen.generate(tmp_path)
+    
+    asm_module = load_generated_module(asm_file)
+    Assembler = asm_module.Assembler
+    
+    assembler = Assembler()
+    machine_code = assembler.assemble("ADD_HEX R0, R1")
+    
+    sim.load_program(machine_code)
+    sim.step()
+    
+    assert sim.R[0] == 26, f"Expected R[0] = 26, got {sim.R[0]}"
 
 
 # ============================================================================
@@ -305,244 +293,214 @@ def test_external_behavior_flag(behavior_features_isa):
     assert instr3.external_behavior == False
 
 
-def test_simulator_external_behavior_class(behavior_features_isa):
+def test_simulator_external_behavior_class(behavior_features_isa, tmp_path):
     """Test that simulator generates ExternalBehaviorHandler class."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        generator = SimulatorGenerator(behavior_features_isa)
-        sim_file = generator.generate(tmpdir)
-        
-        with open(sim_file, 'r') as f:
-            code = f.read()
-        
-        # Check for ExternalBehaviorHandler class
-        assert 'class ExternalBehaviorHandler' in code
-        assert 'external_behavior' in code
-        assert 'self.external_behavior' in code
-        
-        # Check for stub methods
-        assert 'def external_op(' in code.lower()
-        assert 'def external_single(' in code.lower()
-        
-        # Check that methods raise NotImplementedError
-        assert 'NotImplementedError' in code
-        assert 'ExternalBehaviorHandler' in code
-
-
-def test_simulator_external_behavior_initialization(behavior_features_isa):
+    generator = SimulatorGenerator(behavior_features_isa)
+    sim_file = generator.generate(tmp_path)
+    
+    with open(sim_file, 'r') as f:
+        code = f.read()
+    
+    # Check for ExternalBehaviorHandler class
+    assert 'class ExternalBehaviorHandler' in code
+    assert 'external_behavior' in code
+    assert 'self.external_behavior' in code
+    
+    # Check for stub methods
+    assert 'def external_op(' in code.lower()
+    assert 'def external_single(' in code.lower()
+    
+    # Check that methods raise NotImplementedError
+    assert 'NotImplementedError' in code
+    assert 'ExternalBehaviorHandler' in code
+
+
+def test_simulator_external_behavior_initialization(behavior_features_isa, tmp_path):
     """Test that simulator initializes external behavior handler."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        generator = SimulatorGenerator(behavior_features_isa)
-        sim_file = generator.generate(tmpdir)
-        
-        spec = importlib.util.spec_from_file_location("simulator", sim_file)
-        simulator_module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(simulator_module)
-        Simulator = simulator_module.Simulator
-        
-        sim = Simulator()
-        
-        # Check that external_behavior handler is initialized
-        assert hasattr(sim, 'external_behavior')
-        assert sim.external_behavior is not None
-        assert hasattr(sim.external_behavior, 'simulator')
-
-
-def test_external_behavior_not_implemented_error(behavior_features_isa):
+    generator = SimulatorGenerator(behavior_features_isa)
+    sim_file = generator.generate(tmp_path)
+    
+    simulator_module = load_generated_module(sim_file)
+    Simulator = simulator_module.Simulator
+    
+    sim = Simulator()
+    
+    # Check that external_behavior handler is initialized
+    assert hasattr(sim, 'external_behavior')
+    assert sim.external_behavior is not None
+    assert hasattr(sim.external_behavior, 'simulator')
+
+
+def test_external_behavior_not_implemented_error(behavior_features_isa, tmp_path):
     """Test that external behavior methods raise NotImplementedError."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        generator = SimulatorGenerator(behavior_features_isa)
-        sim_file = generator.generate(tmpdir)
-        
-        spec = importlib.util.spec_from_file_location("simulator", sim_file)
-        simulator_module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(simulator_module)
-        Simulator = simulator_module.Simulator
-        
-        sim = Simulator()
-        
-        # Try to call external behavior method - should raise NotImplementedError
-        with pytest.raises(NotImplementedError):
-            sim.external_behavior.external_op(0, 1, 2)
-        
-        with pytest.raises(NotImplementedError):
-            sim.external_behavior.external_single(0)
-
-
-def test_external_behavior_custom_implementation(behavior_features_isa):
-    """Test custom implementation of external behavior."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        generator = SimulatorGenerator(behavior_features_isa)
-        sim_file = generator.generate(tmpdir)
-        
-        spec = importlib.util.spec_from_file_location("simulator", sim_file)
-        simulator_module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(simulator_module)
-        Simulator = simulator_module.Simulator
-        ExternalBehaviorHandler = simulator_module.ExternalBehaviorHandler
-        
-        # Create custom handler
-        class CustomHandler(ExternalBehaviorHandler):
-            def external_op(self, rd, rs1, rs2):
-                # Custom implementation: R[rd] = R[rs1] + R[rs2] + 100
-                self.simulator.R[rd] = self.simulator.R[rs1] + self.simulator.R[rs2] + 100
-        
-        sim = Simulator()
-        sim.external_behavior = CustomHandler(sim)
-        sim.R[1] = 5
-        sim.R[2] = 3
-        
-        # Execute external behavior
+    generator = SimulatorGenerator(behavior_features_isa)
+    sim_file = generator.generate(tmp_path)
+    
+    simulator_module = load_generated_module(sim_file)
+    Simulator = simulator_module.Simulator
+    
+    sim = Simulator()
+    
+    # Try to call external behavior method - should raise NotImplementedError
+    with pytest.raises(NotImplementedError):
         sim.external_behavior.external_op(0, 1, 2)
-        
-        # R[0] = R[1] + R[2] + 100 = 5 + 3 + 100 = 108
-        assert sim.R[0] == 108, f"Expected R[0] = 108, got {sim.R[0]}"
+    
+    with pytest.raises(NotImplementedError):
+        sim.external_behavior.external_single(0)
+
+
+def test_external_behavior_custom_implementation(behavior_features_isa, tmp_path):
+    """Test custom implementation of external behavior."""
+    generator = SimulatorGenerator(behavior_features_isa)
+    sim_file = generator.generate(tmp_path)
+    
+    simulator_module = load_generated_module(sim_file)
+    Simulator = simulator_module.Simulator
+    ExternalBehaviorHandler = simulator_module.ExternalBehaviorHandler
+    
+    # Create custom handler
+    class CustomHandler(ExternalBehaviorHandler):
+        def external_op(self, rd, rs1, rs2):
+            # Custom implementation: R[rd] = R[rs1] + R[rs2] + 100
+            self.simulator.R[rd] = self.simulator.R[rs1] + self.simulator.R[rs2] + 100
+    
+    sim = Simulator()
+    sim.external_behavior = CustomHandler(sim)
+    sim.R[1] = 5
+    sim.R[2] = 3
+    
+    # Execute external behavior
+    sim.external_behavior.external_op(0, 1, 2)
+    
+    # R[0] = R[1] + R[2] + 100 = 5 + 3 + 100 = 108
+    assert sim.R[0] == 108, f"Expected R[0] = 108, got {sim.R[0]}"
 
 
 # ============================================================================
 # Integration Tests
 # ============================================================================
 
-def test_end_to_end_temporary_variables(behavior_features_isa):
+def test_end_to_end_temporary_variables(behavior_features_isa, tmp_path):
     """End-to-end test: assemble, simulate with temporary variables."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        # Generate tools
-        sim_gen = SimulatorGenerator(behavior_features_isa)
-        sim_file = sim_gen.generate(tmpdir)
-        
-        asm_gen = AssemblerGenerator(behavior_features_isa)
-        asm_file = asm_gen.generate(tmpdir)
-        
-        # Import modules
-        sim_spec = importlib.util.spec_from_file_location("simulator", sim_file)
-        sim_module = importlib.util.module_from_spec(sim_spec)
-        sim_spec.loader.exec_module(sim_module)
-        Simulator = sim_module.Simulator
-        
-        asm_spec = importlib.util.spec_from_file_location("assembler", asm_file)
-        asm_module = importlib.util.module_from_spec(asm_spec)
-        asm_spec.loader.exec_module(asm_module)
-        Assembler = asm_module.Assembler
-        
-        # Assemble and run
-        assembler = Assembler()
-        sim = Simulator()
-        
-        sim.R[1] = 10
-        sim.R[2] = 20
-        
-        machine_code = assembler.assemble("COMPLEX_OP R0, R1, R2")
-        sim.load_program(machine_code)
-        sim.step()
-        
-        # sum = 10 + 20 = 30, product = 10 * 20 = 200, result = 30 + 200 = 230
-        assert sim.R[0] == 230, f"Expected R[0] = 230, got {sim.R[0]}"
-
-
-def test_end_to_end_hex_values(behavior_features_isa):
+    # Generate tools
+    sim_gen = SimulatorGenerator(behavior_features_isa)
+    sim_file = sim_gen.generate(tmp_path)
+    
+    asm_gen = AssemblerGenerator(behavior_features_isa)
+    asm_file = asm_gen.generate(tmp_path)
+    
+    # Import modules
+    sim_module = load_generated_module(sim_file)
+    Simulator = sim_module.Simulator
+    
+    asm_module = load_generated_module(asm_file)
+    Assembler = asm_module.Assembler
+    
+    # Assemble and run
+    assembler = Assembler()
+    sim = Simulator()
+    
+    sim.R[1] = 10
+    sim.R[2] = 20
+    
+    machine_code = assembler.assemble("COMPLEX_OP R0, R1, R2")
+    sim.load_program(machine_code)
+    sim.step()
+    
+    # sum = 10 + 20 = 30, product = 10 * 20 = 200, result = 30 + 200 = 230
+    assert sim.R[0] == 230, f"Expected R[0] = 230, got {sim.R[0]}"
+
+
+def test_end_to_end_hex_values(behavior_features_isa, tmp_path):
     """End-to-end test: assemble, simulate with hex values."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        sim_gen = SimulatorGenerator(behavior_features_isa)
-        sim_file = sim_gen.generate(tmpdir)
-        
-        asm_gen = AssemblerGenerator(behavior_features_isa)
-        asm_file = asm_gen.generate(tmpdir)
-        
-        sim_spec = importlib.util.spec_from_file_location("simulator", sim_file)
-        sim_module = importlib.util.module_from_spec(sim_spec)
-        sim_spec.loader.exec_module(sim_module)
-        Simulator = sim_module.Simulator
-        
-        asm_spec = importlib.util.spec_from_file_location("assembler", asm_file)
-        asm_module = importlib.util.module_from_spec(asm_spec)
-        asm_spec.loader.exec_module(asm_module)
-        Assembler = asm_module.Assembler
-        
-        assembler = Assembler()
-        sim = Simulator()
-        
-        sim.R[1] = 1
-        sim.R[2] = 2
-        
-        machine_code = assembler.assemble("ADD_HEX_EXPR R0, R1, R2")
-        sim.load_program(machine_code)
-        sim.step()
-        
-        # R[0] = R[1] + R[2] + 0xFF = 1 + 2 + 255 = 258
-        assert sim.R[0] == 258, f"Expected R[0] = 258, got {sim.R[0]}"
-
-
-def test_end_to_end_mixed_features(behavior_features_isa):
+    sim_gen = SimulatorGenerator(behavior_features_isa)
+    sim_file = sim_gen.generate(tmp_path)
+    
+    asm_gen = AssemblerGenerator(behavior_features_isa)
+    asm_file = asm_gen.generate(tmp_path)
+    
+    sim_module = load_generated_module(sim_file)
+    Simulator = sim_module.Simulator
+    
+    asm_module = load_generated_module(asm_file)
+    Assembler = asm_module.Assembler
+    
+    assembler = Assembler()
+    sim = Simulator()
+    
+    sim.R[1] = 1
+    sim.R[2] = 2
+    
+    machine_code = assembler.assemble("ADD_HEX_EXPR R0, R1, R2")
+    sim.load_program(machine_code)
+    sim.step()
+    
+    # R[0] = R[1] + R[2] + 0xFF = 1 + 2 + 255 = 258
+    assert sim.R[0] == 258, f"Expected R[0] = 258, got {sim.R[0]}"
+
+
+def test_end_to_end_mixed_features(behavior_features_isa, tmp_path):
     """End-to-end test with mixed features: temp variables and hex values."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        sim_gen = SimulatorGenerator(behavior_features_isa)
-        sim_file = sim_gen.generate(tmpdir)
-        
-        asm_gen = AssemblerGenerator(behavior_features_isa)
-        asm_file = asm_gen.generate(tmpdir)
-        
-        sim_spec = importlib.util.spec_from_file_location("simulator", sim_file)
-        sim_module = importlib.util.module_from_spec(sim_spec)
-        sim_spec.loader.exec_module(sim_module)
-        Simulator = sim_module.Simulator
-        
-        asm_spec = importlib.util.spec_from_file_location("assembler", asm_file)
-        asm_module = importlib.util.module_from_spec(asm_spec)
-        asm_spec.loader.exec_module(asm_module)
-        Assembler = asm_module.Assembler
-        
-        assembler = Assembler()
-        sim = Simulator()
-        
-        sim.R[1] = 1
-        sim.R[2] = 2
-        
-        machine_code = assembler.assemble("COMPLEX_HEX_TEMP R0, R1, R2")
-        sim.load_program(machine_code)
-        sim.step()
-        
-        # temp1 = 1 + 0x100 = 257, temp2 = 2 + 0x200 = 514
-        # result = 257 * 514 = 132098, R[0] = 132098 & 0xFFFF = 1026 (truncated to 16 bits)
-        assert sim.R[0] == 1026, f"Expected R[0] = 1026, got {sim.R[0]}"
-
-
-def test_disassembler_with_behavior_features(behavior_features_isa):
+    sim_gen = SimulatorGenerator(behavior_features_isa)
+    sim_file = sim_gen.generate(tmp_path)
+    
+    asm_gen = AssemblerGenerator(behavior_features_isa)
+    asm_file = asm_gen.generate(tmp_path)
+    
+    sim_module = load_generated_module(sim_file)
+    Simulator = sim_module.Simulator
+    
+    asm_module = load_generated_module(asm_file)
+    Assembler = asm_module.Assembler
+    
+    assembler = Assembler()
+    sim = Simulator()
+    
+    sim.R[1] = 1
+    sim.R[2] = 2
+    
+    machine_code = assembler.assemble("COMPLEX_HEX_TEMP R0, R1, R2")
+    sim.load_program(machine_code)
+    sim.step()
+    
+    # temp1 = 1 + 0x100 = 257, temp2 = 2 + 0x200 = 514
+    # result = 257 * 514 = 132098, R[0] = 132098 & 0xFFFF = 1026 (truncated to 16 bits)
+    assert sim.R[0] == 1026, f"Expected R[0] = 1026, got {sim.R[0]}"
+
+
+def test_disassembler_with_behavior_features(behavior_features_isa, tmp_path):
     """Test disassembler with instructions using behavior features."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        asm_gen = AssemblerGenerator(behavior_features_isa)
-        asm_file = asm_gen.generate(tmpdir)
-        
-        disasm_gen = DisassemblerGenerator(behavior_features_isa)
-        disasm_file = disasm_gen.generate(tmpdir)
-        
-        asm_spec = importlib.util.spec_from_file_location("assembler", asm_file)
-        asm_module = importlib.util.module_from_spec(asm_spec)
-        asm_spec.loader.exec_module(asm_module)
-        Assembler = asm_module.Assembler
-        
-        disasm_spec = importlib.util.spec_from_file_location("disassembler", disasm_file)
-        disasm_module = importlib.util.module_from_spec(disasm_spec)
-        disasm_spec.loader.exec_module(disasm_module)
-        Disassembler = disasm_module.Disassembler
-        
-        assembler = Assembler()
-        disassembler = Disassembler()
-        
-        # Assemble instructions
-        code = "ADD_TEMP R0, R1, R2\nADD_HEX R3, R4\nCOMPLEX_OP R5, R6, R7"
-        machine_code = assembler.assemble(code)
-        
-        # Disassemble each instruction individually
-        # disassemble() expects a single instruction word (int), not a list
-        instructions = []
-        for instr_word in machine_code:
-            asm = disassembler.disassemble(instr_word)
-            if asm:
-                instructions.append((0, asm))  # Use dummy address
-        
-        assert len(instructions) >= 3
-        # Check that disassembled instructions contain expected mnemonics
-        asm_text = " ".join([asm for _, asm in instructions])
-        assert "ADD_TEMP" in asm_text or "add_temp" in asm_text.lower()
-        assert "ADD_HEX" in asm_text or "add_hex" in asm_text.lower()
-        assert "COMPLEX_OP" in asm_text or "complex_op" in asm_text.lower()
+    asm_gen = AssemblerGenerator(behavior_features_isa)
+    asm_file = asm_gen.generate(tmp_path)
+    
+    disasm_gen = DisassemblerGenerator(behavior_features_isa)
+    disasm_file = disasm_gen.generate(tmp_path)
+    
+    asm_module = load_generated_module(asm_file)
+    Assembler = asm_module.Assembler
+    
+    disasm_module = load_generated_module(disasm_file)
+    Disassembler = disasm_module.Disassembler
+    
+    assembler = Assembler()
+    disassembler = Disassembler()
+    
+    # Assemble instructions
+    code = "ADD_TEMP R0, R1, R2\nADD_HEX R3, R4\nCOMPLEX_OP R5, R6, R7"
+    machine_code = assembler.assemble(code)
+    
+    # Disassemble each instruction individually
+    # disassemble() expects a single instruction word (int), not a list
+    instructions = []
+    for instr_word in machine_code:
+        asm = disassembler.disassemble(instr_word)
+        if asm:
+            instructions.append((0, asm))  # Use dummy address
+    
+    assert len(instructions) >= 3
+    # Check that disassembled instructions contain expected mnemonics
+    asm_text = " ".join([asm for _, asm in instructions])
+    assert "ADD_TEMP" in asm_text or "add_temp" in asm_text.lower()
+    assert "ADD_HEX" in asm_text or "add_hex" in asm_text.lower()
+    assert "COMPLEX_OP" in asm_text or "complex_op" in asm_text.lower()
 
@@ -7,7 +7,7 @@ from isa_dsl.model.parser import parse_isa_file
 from tests.bundling.test_helpers import BundlingTestHelpers
 
 
-def test_bundle_assembly_syntax():
+def test_bundle_assembly_syntax(tmp_path):
     """Test that disassembler uses assembly_syntax format string for bundles."""
     test_isa_content = '''architecture TestBundle {
     word_size: 32
@@ -28,18 +28,16 @@ def test_bundle_assembly_syntax():
         bundle_instr = BundlingTestHelpers.find_instruction_by_mnemonic(isa, 'BUNDLE')
         assert bundle_instr is not None and bundle_instr.assembly_syntax == "BUNDLE[ {slot0}, {slot1} ]"
         
-        import tempfile
-        with tempfile.TemporaryDirectory() as tmpdir:
-            Assembler, Disassembler = BundlingTestHelpers.generate_and_import_tools(isa, tmpdir)
-            asm = Assembler()
-            disasm = Disassembler()
-            result, _ = BundlingTestHelpers.test_bundle_round_trip(asm, disasm, "BUNDLE{ ADD R3, R4, R5, ADD R6, R7, R8 }")
-            assert "BUNDLE" in result and ("slot0" in result or "ADD" in result)
+        Assembler, Disassembler = BundlingTestHelpers.generate_and_import_tools(isa, tmp_path)
+        asm = Assembler()
+        disasm = Disassembler()
+        result, _ = BundlingTestHelpers.test_bundle_round_trip(asm, disasm, "BUNDLE{ ADD R3, R4, R5, ADD R6, R7, R8 }")
+        assert "BUNDLE" in result and ("slot0" in result or "ADD" in result)
     finally:
         Path(test_isa_file).unlink()
 
 
-def test_bundle_default_format():
+def test_bundle_default_format(tmp_path):
     """Test that bundles without assembly_syntax use default format."""
     test_isa_content = '''architecture TestBundle {
     word_size: 32
@@ -60,11 +58,9 @@ def test_bundle_default_format():
         bundle_instr = BundlingTestHelpers.find_instruction_by_mnemonic(isa, 'BUNDLE')
         assert bundle_instr is not None and bundle_instr.assembly_syntax is None
         
-        import tempfile
-        with tempfile.TemporaryDirectory() as tmpdir:
-            Disassembler = BundlingTestHelpers.generate_disassembler_only(isa, tmpdir)
-            disasm = Disassembler()
-            assert disasm is not None
+        Disassembler = BundlingTestHelpers.generate_disassembler_only(isa, tmp_path)
+        disasm = Disassembler()
+        assert disasm is not None
     finally:
         Path(test_isa_file).unlink()
 
@@ -2,20 +2,18 @@
 
 import pytest
 from pathlib import Path
-import tempfile
-import importlib.util
-from isa_dsl.model.parser import parse_isa_file
 from isa_dsl.model.validator import ISAValidator
 from isa_dsl.generators.simulator import SimulatorGenerator
 from isa_dsl.generators.assembler import AssemblerGenerator
 from tests.bundling.test_helpers import BundlingTestHelpers
+from tests.tool_cache import load_generated_module, load_isa
 
 
 def test_parse_bundle_format():
     """Test parsing bundle format definitions."""
     test_data_dir = Path(__file__).parent / "test_data"
     isa_file = test_data_dir / 'bundling.isa'
-    isa = parse_isa_file(str(isa_file))
+    isa = load_isa(isa_file)
     
     assert isa.name == 'BundledISA'
     
@@ -44,7 +42,7 @@ def test_parse_bundle_instruction():
     """Test parsing bundle instruction definitions."""
     test_data_dir = Path(__file__).parent / "test_data"
     isa_file = test_data_dir / 'bundling.isa'
-    isa = parse_isa_file(str(isa_file))
+    isa = load_isa(isa_file)
     
     # Find bundle instruction
     bundle_instr = None
@@ -67,7 +65,7 @@ def test_bundle_encoding_matching():
     """Test that bundle encoding matching works correctly."""
     test_data_dir = Path(__file__).parent / "test_data"
     isa_file = test_data_dir / 'bundling.isa'
-    isa = parse_isa_file(str(isa_file))
+    isa = load_isa(isa_file)
     
     bundle_instr = None
     for instr in isa.instructions:
@@ -97,7 +95,7 @@ def test_bundle_slot_extraction():
     """Test extracting sub-instructions from bundle slots."""
     test_data_dir = Path(__file__).parent / "test_data"
     isa_file = test_data_dir / 'bundling.isa'
-    isa = parse_isa_file(str(isa_file))
+    isa = load_isa(isa_file)
     
     bundle_fmt = isa.get_bundle_format('BUNDLE_64')
     assert bundle_fmt is not None
@@ -122,7 +120,7 @@ def test_bundle_instruction_validation():
     """Test validation of bundle instructions."""
     test_data_dir = Path(__file__).parent / "test_data"
     isa_file = test_data_dir / 'bundling.isa'
-    isa = parse_isa_file(str(isa_file))
+    isa = load_isa(isa_file)
     
     validator = ISAValidator(isa)
     errors = validator.validate()
@@ -131,124 +129,117 @@ def test_bundle_instruction_validation():
     assert len(errors) == 0, f"Validation should pass, but got errors: {[str(e) for e in errors]}"
 
 
-def test_generated_simulator_bundle_detection():
+def test_generated_simulator_bundle_detection(tmp_path):
     """Test that generated simulator can detect bundle instructions."""
     test_data_dir = Path(__file__).parent / "test_data"
     isa_file = test_data_dir / 'bundling.isa'
-    isa = parse_isa_file(str(isa_file))
-    
-    with tempfile.TemporaryDirectory() as tmpdir:
-        sim_gen = SimulatorGenerator(isa)
-        sim_file = sim_gen.generate(tmpdir)
-        assert sim_file.exists()
-        
-        # Check generated code contains bundle handling
-        code = sim_file.read_text()
-        assert 'BUNDLE' in code, "Generated simulator should handle BUNDLE instruction"
-        assert '_matches_BUNDLE' in code, "Should have bundle matching function"
-        assert '_execute_BUNDLE' in code, "Should have bundle execution function"
+    isa = load_isa(isa_file)
+    
+    sim_gen = SimulatorGenerator(isa)
+    sim_file = sim_gen.generate(tmp_path)
+    assert sim_file.exists()
+    
+    # Check generated code contains bundle handling
+    code = sim_file.read_text()
+    assert 'BUNDLE' in code, "Generated simulator should handle BUNDLE instruction"
+    assert '_matches_BUNDLE' in code, "Should have bundle matching function"
+    assert '_execute_BUNDLE' in code, "Should have bundle execution function"
 
 
-def test_generated_assembler_bundle_syntax():
+def test_generated_assembler_bundle_syntax(tmp_path):
     """Test that generated assembler recognizes bundle syntax."""
     test_data_dir = Path(__file__).parent / "test_data"
     isa_file = test_data_dir / 'bundling.isa'
-    isa = parse_isa_file(str(isa_file))
-    
-    with tempfile.TemporaryDirectory() as tmpdir:
-        asm_gen = AssemblerGenerator(isa)
-        asm_file = asm_gen.generate(tmpdir)
-        assert asm_file.exists()
-        
-        # Check generated code contains bundle handling
-        code = asm_file.read_text()
-        assert 'bundle{' in code.lower() or 'BUNDLE{' in code, "Generated assembler should handle bundle syntax"
-        assert '_assemble_bundle' in code, "Should have bundle assembly function"
-        assert '_encode_bundle_BUNDLE' in code, "Should have bundle encoding function"
+    isa = load_isa(isa_file)
+    
+    asm_gen = AssemblerGenerator(isa)
+    asm_file = asm_gen.generate(tmp_path)
+    assert asm_file.exists()
+    
+    # Check generated code contains bundle handling
+    code = asm_file.read_text()
+    assert 'bundle{' in code.lower() or 'BUNDLE{' in code, "Generated assembler should handle bundle syntax"
+    assert '_assemble_bundle' in code, "Should have bundle assembly function"
+    assert '_encode_bundle_BUNDLE' in code, "Should have bundle encoding function"
 
 
-def test_bundle_assembly():
+def test_bundle_assembly(tmp_path):
     """Test assembling bundle instructions."""
     test_data_dir = Path(__file__).parent / "test_data"
     isa_file = test_data_dir / 'bundling.isa'
-    isa = parse_isa_file(str(isa_file))
-    
-    with tempfile.TemporaryDirectory() as tmpdir:
-        asm_gen = AssemblerGenerator(isa)
-        asm_file = asm_gen.generate(tmpdir)
-        
-        # Import generated assembler
-        spec = importlib.util.spec_from_file_location("assembler", asm_file)
-        asm_module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(asm_module)
-        Assembler = asm_module.Assembler
-        
-        assembler = Assembler()
-        
-        # Test assembling a bundle
-        # Note: Bundle syntax is bundle{instr1, instr2}
-        assembly_code = "bundle{ADD R1, R2, R3, SUB R4, R5, R6}"
-        machine_code = assembler.assemble(assembly_code)
-        
-        assert len(machine_code) > 0, "Should assemble bundle instruction"
-        # Bundle should be 64 bits (8 bytes), but assembler returns 32-bit words
-        # So we might get 2 words or the assembler might handle it differently
-        assert isinstance(machine_code[0], int), "Machine code should be integers"
+    isa = load_isa(isa_file)
+    
+    asm_gen = AssemblerGenerator(isa)
+    asm_file = asm_gen.generate(tmp_path)
+    
+    # Import generated assembler
+    asm_module = load_generated_module(asm_file)
+    Assembler = asm_module.Assembler
+    
+    assembler = Assembler()
+    
+    # Test assembling a bundle
+    # Note: Bundle syntax is bundle{instr1, instr2}
+    assembly_code = "bundle{ADD R1, R2, R3, SUB R4, R5, R6}"
+    machine_code = assembler.assemble(assembly_code)
+    
+    assert len(machine_code) > 0, "Should assemble bundle instruction"
+    # Bundle should be 64 bits (8 bytes), but assembler returns 32-bit words
+    # So we might get 2 words or the assembler might handle it differently
+    assert isinstance(machine_code[0], int), "Machine code should be integers"
 
 
-def test_bundle_simulation():
+def test_bundle_simulation(tmp_path):
     """Test simulating bundle instructions."""
     test_data_dir = Path(__file__).parent / "test_data"
     isa_file = test_data_dir / 'bundling.isa'
-    isa = parse_isa_file(str(isa_file))
-    
-    with tempfile.TemporaryDirectory() as tmpdir:
-        Simulator = BundlingTestHelpers.generate_and_import_simulator(isa, tmpdir)
-        sim = Simulator()
-        
-        add_instr = 0x00000001 | (1 << 6) | (2 << 9) | (3 << 12)
-        sub_instr = 0x00000002 | (4 << 6) | (5 << 9) | (6 << 12)
-        bundle_word = BundlingTestHelpers.create_bundle_word(add_instr, sub_instr)
-        
-        BundlingTestHelpers.load_bundle_to_memory(sim, bundle_word)
-        BundlingTestHelpers.setup_simulator_registers(sim)
-        
-        executed = sim.step()
-        assert executed is not None, "Bundle execution should not crash"
+    isa = load_isa(isa_file)
+    
+    Simulator = BundlingTestHelpers.generate_and_import_simulator(isa, tmp_path)
+    sim = Simulator()
+    
+    add_instr = 0x00000001 | (1 << 6) | (2 << 9) | (3 << 12)
+    sub_instr = 0x00000002 | (4 << 6) | (5 << 9) | (6 << 12)
+    bundle_word = BundlingTestHelpers.create_bundle_word(add_instr, sub_instr)
+    
+    BundlingTestHelpers.load_bundle_to_memory(sim, bundle_word)
+    BundlingTestHelpers.setup_simulator_registers(sim)
+    
+    executed = sim.step()
+    assert executed is not None, "Bundle execution should not crash"
 
 
-def test_bundle_end_to_end():
+def test_bundle_end_to_end(tmp_path):
     """Test end-to-end bundle workflow: assemble and simulate."""
     test_data_dir = Path(__file__).parent / "test_data"
     isa_file = test_data_dir / 'bundling.isa'
-    isa = parse_isa_file(str(isa_file))
-    
-    with tempfile.TemporaryDirectory() as tmpdir:
-        Assembler, Simulator = BundlingTestHelpers.generate_and_import_assembler_simulator(isa, tmpdir)
-        assembler = Assembler()
-        sim = Simulator()
-        
-        BundlingTestHelpers.setup_simulator_registers(sim)
-        
-        machine_code = assembler.assemble("bundle{ADD R1, R2, R3, SUB R4, R5, R6}")
-        assert len(machine_code) > 0, "Should assemble bundle"
-        
-        if len(machine_code) >= 2:
-            sim.memory[0] = machine_code[0]
-            sim.memory[4] = machine_code[1]
-        else:
-            sim.memory[0] = machine_code[0]
-        sim.pc = 0
-        
-        executed = sim.step()
-        assert executed is not None, "Bundle should execute"
+    isa = load_isa(isa_file)
+    
+    Assembler, Simulator = BundlingTestHelpers.generate_and_import_assembler_simulator(isa, tmp_path)
+    assembler = Assembler()
+    sim = Simulator()
+    
+    BundlingTestHelpers.setup_simulator_registers(sim)
+    
+    machine_code = assembler.assemble("bundle{ADD R1, R2, R3, SUB R4, R5, R6}")
+    assert len(machine_code) > 0, "Should assemble bundle"
+    
+    if len(machine_code) >= 2:
+        sim.memory[0] = machine_code[0]
+        sim.memory[4] = machine_code[1]
+    else:
+        sim.memory[0] = machine_code[0]
+    sim.pc = 0
+    
+    executed = sim.step()
+    assert executed is not None, "Bundle should execute"
 
 
 def test_bundle_format_slot_encoding():
     """Test encoding instructions into bundle slots."""
     test_data_dir = Path(__file__).parent / "test_data"
     isa_file = test_data_dir / 'bundling.isa'
-    isa = parse_isa_file(str(isa_file))
+    isa = load_isa(isa_file)
     
     bundle_fmt = isa.get_bundle_format('BUNDLE_64')
     assert bundle_fmt is not None
@@ -1,11 +1,11 @@
 """Helper methods for bundling tests."""
 
 import tempfile
-import importlib.util
 from pathlib import Path
 
 from isa_dsl.generators.disassembler import DisassemblerGenerator
 from isa_dsl.generators.assembler import AssemblerGenerator
+from tests.tool_cache import load_generated_module
 
 
 class BundlingTestHelpers:
@@ -35,14 +35,10 @@ class BundlingTestHelpers:
         disasm_file = Path(tmpdir_path) / "disassembler.py"
         asm_file = Path(tmpdir_path) / "assembler.py"
         
-        disasm_spec = importlib.util.spec_from_file_location("disassembler", disasm_file)
-        disassembler_module = importlib.util.module_from_spec(disasm_spec)
-        disasm_spec.loader.exec_module(disassembler_module)
+        disassembler_module = load_generated_module(disasm_file)
         Disassembler = disassembler_module.Disassembler
         
-        asm_spec = importlib.util.spec_from_file_location("assembler", asm_file)
-        assembler_module = importlib.util.module_from_spec(asm_spec)
-        asm_spec.loader.exec_module(assembler_module)
+        assembler_module = load_generated_module(asm_file)
         Assembler = assembler_module.Assembler
         
         return Assembler, Disassembler
@@ -63,9 +59,7 @@ class BundlingTestHelpers:
         disasm_gen.generate(tmpdir_path)
         
         disasm_file = Path(tmpdir_path) / "disassembler.py"
-        disasm_spec = importlib.util.spec_from_file_location("disassembler", disasm_file)
-        disassembler_module = importlib.util.module_from_spec(disasm_spec)
-        disasm_spec.loader.exec_module(disassembler_module)
+        disassembler_module = load_generated_module(disasm_file)
         return disassembler_module.Disassembler
     
     @staticmethod
@@ -76,9 +70,7 @@ class BundlingTestHelpers:
         sim_gen = SimulatorGenerator(isa)
         sim_file = sim_gen.generate(tmpdir_path)
         
-        spec = importlib.util.spec_from_file_location("simulator", sim_file)
-        sim_module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(sim_module)
+        sim_module = load_generated_module(sim_file)
         return sim_module.Simulator
     
     @staticmethod
@@ -92,13 +84,9 @@ class BundlingTestHelpers:
         sim_gen = SimulatorGenerator(isa)
         sim_file = sim_gen.generate(tmpdir_path)
         
-        asm_spec = importlib.util.spec_from_file_location("assembler", asm_file)
-        asm_module = importlib.util.module_from_spec(asm_spec)
-        asm_spec.loader.exec_module(asm_module)
+        asm_module = load_generated_module(asm_file)
         
-        sim_spec = importlib.util.spec_from_file_location("simulator", sim_file)
-        sim_module = importlib.util.module_from_spec(sim_spec)
-        sim_spec.loader.exec_module(sim_module)
+        sim_module = load_generated_module(sim_file)
         
         return asm_module.Assembler, sim_module.Simulator
     
@@ -0,0 +1,17 @@
+"""Shared fixtures for the ISA DSL test suite."""
+
+import pytest
+
+from tests.tool_cache import get_generated_tools
+
+
+@pytest.fixture(scope="session")
+def generated_tools():
+    """Factory returning cached (Simulator, Assembler, Disassembler) classes for an ISA file.
+
+    Usage: ``Simulator, Assembler, Disassembler = generated_tools(isa_file)``.
+    Each ISA file is generated and imported once per session, in memory, so
+    pytest-xdist workers never write to the same files.
+    """
+    return get_generated_tools
+
@@ -218,7 +218,7 @@ def test_instruction_with_format_constant():
     assert len(validator.errors) == 0
 
 
-def test_assembler_with_format_constant():
+def test_assembler_with_format_constant(tmp_path):
     """Test assembler encoding with format constant."""
     isa_text = """
     formats {
@@ -242,10 +242,9 @@ def test_assembler_with_format_constant():
     # Generate assembler
     from isa_dsl.generators.assembler import AssemblerGenerator
     generator = AssemblerGenerator(isa)
-    with tempfile.TemporaryDirectory() as tmp_dir:
-        generator.generate(tmp_dir)
-        assembler_file = Path(tmp_dir) / 'assembler.py'
-        assembler_code = assembler_file.read_text()
+    generator.generate(tmp_path)
+    assembler_file = Path(tmp_path) / 'assembler.py'
+    assembler_code = assembler_file.read_text()
     
     # Execute assembler
     exec(assembler_code, globals())
@@ -264,7 +263,7 @@ def test_assembler_with_format_constant():
     assert opcode == 0x01
 
 
-def test_simulator_with_format_constant():
+def test_simulator_with_format_constant(tmp_path):
     """Test simulator matching with format constant."""
     isa_text = """
     registers {
@@ -294,10 +293,9 @@ def test_simulator_with_format_constant():
     # Generate simulator
     from isa_dsl.generators.simulator import SimulatorGenerator
     generator = SimulatorGenerator(isa)
-    with tempfile.TemporaryDirectory() as tmp_dir:
-        generator.generate(tmp_dir)
-        simulator_file = Path(tmp_dir) / 'simulator.py'
-        simulator_code = simulator_file.read_text()
+    generator.generate(tmp_path)
+    simulator_file = Path(tmp_path) / 'simulator.py'
+    simulator_code = simulator_file.read_text()
     
     # Execute simulator
     exec(simulator_code, globals())
@@ -314,7 +312,7 @@ def test_simulator_with_format_constant():
     assert sim._matches_ADD(wrong_instruction) is False
 
 
-def test_disassembler_with_format_constant():
+def test_disassembler_with_format_constant(tmp_path):
     """Test disassembler with format constant (constant not shown as operand)."""
     isa_text = """
     formats {
@@ -338,10 +336,9 @@ def test_disassembler_with_format_constant():
     # Generate disassembler
     from isa_dsl.generators.disassembler import DisassemblerGenerator
     generator = DisassemblerGenerator(isa)
-    with tempfile.TemporaryDirectory() as tmp_dir:
-        generator.generate(tmp_dir)
-        disassembler_file = Path(tmp_dir) / 'disassembler.py'
-        disassembler_code = disassembler_file.read_text()
+    generator.generate(tmp_path)
+    disassembler_file = Path(tmp_path) / 'disassembler.py'
+    disassembler_code = disassembler_file.read_text()
     
     # Execute disassembler
     exec(disassembler_code, globals())
@@ -363,7 +360,7 @@ def test_disassembler_with_format_constant():
         assert "R3" in result or "3" in result
 
 
-def test_assembler_with_format_constant_and_instruction_encoding():
+def test_assembler_with_format_constant_and_instruction_encoding(tmp_path):
     """Test assembler with both format constant and instruction encoding constants."""
     isa_text = """
     formats {
@@ -390,10 +387,9 @@ def test_assembler_with_format_constant_and_instruction_encoding():
     # Generate assembler
     from isa_dsl.generators.assembler import AssemblerGenerator
     generator = AssemblerGenerator(isa)
-    with tempfile.TemporaryDirectory() as tmp_dir:
-        generator.generate(tmp_dir)
-        assembler_file = Path(tmp_dir) / 'assembler.py'
-        assembler_code = assembler_file.read_text()
+    generator.generate(tmp_path)
+    assembler_file = Path(tmp_path) / 'assembler.py'
+    assembler_code = assembler_file.read_text()
     
     # Execute assembler
     exec(assembler_code, globals())
@@ -436,7 +432,7 @@ def test_assembler_with_format_constant_and_instruction_encoding():
     assert result == expected, f"Expected 0x{expected:X}, got 0x{result:X}"
 
 
-def test_simulator_with_format_constant_and_instruction_encoding():
+def test_simulator_with_format_constant_and_instruction_encoding(tmp_path):
     """Test simulator matching with both format constant and instruction encoding."""
     isa_text = """
     registers {
@@ -468,10 +464,9 @@ def test_simulator_with_format_constant_and_instruction_encoding():
     # Generate simulator
     from isa_dsl.generators.simulator import SimulatorGenerator
     generator = SimulatorGenerator(isa)
-    with tempfile.TemporaryDirectory() as tmp_dir:
-        generator.generate(tmp_dir)
-        simulator_file = Path(tmp_dir) / 'simulator.py'
-        simulator_code = simulator_file.read_text()
+    generator.generate(tmp_path)
+    simulator_file = Path(tmp_path) / 'simulator.py'
+    simulator_code = simulator_file.read_text()
     
     # Execute simulator
     exec(simulator_code, globals())
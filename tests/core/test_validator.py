@@ -46,3 +46,20 @@ def test_instruction_validation():
     instruction_errors = [e for e in errors if 'instruction' in e.message.lower()]
     assert len(instruction_errors) == 0
 
+
+
+def test_validate_result_is_cached():
+    """Test that repeated validation reuses the first result unless forced."""
+    test_data_dir = Path(__file__).parent / "test_data"
+    isa_file = test_data_dir / 'sample_isa.isa'
+    isa = parse_isa_file(str(isa_file))
+    
+    validator = ISAValidator(isa)
+    errors = validator.validate()
+    assert validator.validate() is errors
+    
+    # Forcing re-validation picks up changes made to the ISA
+    isa.formats[0].fields[0].constant_value = -1
+    forced_errors = validator.validate(force=True)
+    assert forced_errors is not errors
+    assert any('non-negative' in e.message for e in forced_errors)
@@ -0,0 +1,25 @@
+"""Shared fixtures for generator tests."""
+
+import pytest
+from pathlib import Path
+
+
+TEST_DATA_DIR = Path(__file__).parent / "test_data"
+
+
+@pytest.fixture(scope="session")
+def minimal_isa_file():
+    """Fixture providing path to the minimal test ISA file."""
+    return TEST_DATA_DIR / "minimal.isa"
+
+
+@pytest.fixture(scope="session")
+def sample_isa_file():
+    """Fixture providing path to the full sample test ISA file."""
+    return TEST_DATA_DIR / "sample_isa.isa"
+
+
+@pytest.fixture(scope="session")
+def tools(generated_tools, minimal_isa_file):
+    """(Simulator, Assembler, Disassembler) classes for minimal.isa, generated once per session."""
+    return generated_tools(minimal_isa_file)
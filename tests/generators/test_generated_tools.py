@@ -1,319 +1,270 @@
 """Tests for generated assembler and simulator functionality."""
 
-import pytest
-from pathlib import Path
-import tempfile
-import subprocess
-import sys
-import importlib.util
-from isa_dsl.model.parser import parse_isa_file
-from isa_dsl.generators.simulator import SimulatorGenerator
-from isa_dsl.generators.assembler import AssemblerGenerator
-from tests.generators.test_helpers import GeneratorTestHelpers
-
-
-def test_assembler_basic_functionality():
+
+def test_assembler_basic_functionality(tools):
     """Test that generated assembler can assemble simple instructions."""
-    test_data_dir = Path(__file__).parent / "test_data"
-    isa_file = test_data_dir / 'minimal.isa'
-    isa = parse_isa_file(str(isa_file))
-    
-    with tempfile.TemporaryDirectory() as tmpdir:
-        # Generate assembler
-        asm_gen = AssemblerGenerator(isa)
-        asm_file = asm_gen.generate(tmpdir)
-        assert asm_file.exists()
-        
-        # Import the generated assembler module
-        spec = importlib.util.spec_from_file_location("assembler", asm_file)
-        assembler_module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(assembler_module)
-        Assembler = assembler_module.Assembler
-        
-        # Create assembler instance
-        assembler = Assembler()
-        
-        # Test assembly of ADD instruction
-        assembly_code = "ADD R1, R0, 5"
-        machine_code = assembler.assemble(assembly_code)
-        
-        assert len(machine_code) > 0, "Assembler should produce machine code"
-        assert isinstance(machine_code[0], int), "Machine code should be integers"
-
-
-def test_simulator_basic_functionality():
+    _, Assembler, _ = tools
+    # Create assembler instance
+    assembler = Assembler()
+
+    # Test assembly of ADD instruction
+    assembly_code = "ADD R1, R0, 5"
+    machine_code = assembler.assemble(assembly_code)
+
+    assert len(machine_code) > 0, "Assembler should produce machine code"
+    assert isinstance(machine_code[0], int), "Machine code should be integers"
+
+
+def test_simulator_basic_functionality(tools):
     """Test that generated simulator can execute instructions."""
-    test_data_dir = Path(__file__).parent / "test_data"
-    isa_file = test_data_dir / 'minimal.isa'
-    isa = parse_isa_file(str(isa_file))
-    
-    with tempfile.TemporaryDirectory() as tmpdir:
-        # Generate simulator
-        sim_gen = SimulatorGenerator(isa)
-        sim_file = sim_gen.generate(tmpdir)
-        assert sim_file.exists()
-        
-        # Import the generated simulator module
-        spec = importlib.util.spec_from_file_location("simulator", sim_file)
-        simulator_module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(simulator_module)
-        Simulator = simulator_module.Simulator
-        
-        # Create simulator instance
-        sim = Simulator()
-        
-        # Test that simulator initializes correctly
-        assert hasattr(sim, 'R'), "Simulator should have R register file"
-        assert hasattr(sim, 'PC'), "Simulator should have PC register"
-        assert hasattr(sim, 'memory'), "Simulator should have memory"
-        assert sim.PC == 0, "PC should initialize to 0"
-        assert len(sim.R) == 4, "R register file should have 4 registers"
-
-
-def test_assembler_simulator_integration():
+    Simulator, _, _ = tools
+    # Create simulator instance
+    sim = Simulator()
+
+    # Test that simulator initializes correctly
+    assert sim.PC == 0, "PC should initialize to 0"
+    assert len(sim.R) == 4, "R register file should have 4 registers"
+    assert sim.memory == {}, "Memory should start empty"
+    assert sim.pc == 0 and sim.instruction_count == 0 and not sim.halted
+
+    # Simulators can carry user-defined attributes
+    sim.trace = []
+    assert sim.trace == []
+
+
+def test_assembler_simulator_integration(tools):
     """Test full workflow: assemble code and run it on simulator."""
-    test_data_dir = Path(__file__).parent / "test_data"
-    isa_file = test_data_dir / 'minimal.isa'
-    isa = parse_isa_file(str(isa_file))
-    
-    with tempfile.TemporaryDirectory() as tmpdir:
-        # Generate both assembler and simulator
-        asm_gen = AssemblerGenerator(isa)
-        asm_file = asm_gen.generate(tmpdir)
-        
-        sim_gen = SimulatorGenerator(isa)
-        sim_file = sim_gen.generate(tmpdir)
-        
-        # Import modules
-        asm_spec = importlib.util.spec_from_file_location("assembler", asm_file)
-        asm_module = importlib.util.module_from_spec(asm_spec)
-        asm_spec.loader.exec_module(asm_module)
-        
-        sim_spec = importlib.util.spec_from_file_location("simulator", sim_file)
-        sim_module = importlib.util.module_from_spec(sim_spec)
-        sim_spec.loader.exec_module(sim_module)
-        
-        Assembler = asm_module.Assembler
-        Simulator = sim_module.Simulator
-        
-        # Create instances
-        assembler = Assembler()
-        sim = Simulator()
-        
-        # Assemble a simple program: R[1] = R[0] + 5
-        # Assuming R[0] starts at 0, R[1] should become 5
-        assembly_code = "ADD R1, R0, 5"
-        machine_code = assembler.assemble(assembly_code)
-        
-        assert len(machine_code) > 0, "Should assemble at least one instruction"
-        
-        # Load program into simulator
-        sim.load_program(machine_code, start_address=0)
-        
-        # Execute one step
-        executed = sim.step()
-        assert executed, "Instruction should execute successfully"
-        
-        # Check that R[1] was updated (R[0] + 5 = 0 + 5 = 5)
-        assert sim.R[1] == 5, f"R[1] should be 5 after ADD R1, R0, 5, got {sim.R[1]}"
-        assert sim.pc == 4, "PC should advance by 4 after one instruction"
-
-
-def test_assembler_simulator_multiple_instructions():
+    Simulator, Assembler, _ = tools
+    # Create instances
+    assembler = Assembler()
+    sim = Simulator()
+
+    # Assemble a simple program: R[1] = R[0] + 5
+    # Assuming R[0] starts at 0, R[1] should become 5
+    assembly_code = "ADD R1, R0, 5"
+    machine_code = assembler.assemble(assembly_code)
+
+    assert len(machine_code) > 0, "Should assemble at least one instruction"
+
+    # Load program into simulator
+    sim.load_program(machine_code, start_address=0)
+
+    # Execute one step
+    executed = sim.step()
+    assert executed, "Instruction should execute successfully"
+
+    # Check that R[1] was updated (R[0] + 5 = 0 + 5 = 5)
+    assert sim.R[1] == 5, f"R[1] should be 5 after ADD R1, R0, 5, got {sim.R[1]}"
+    assert sim.pc == 4, "PC should advance by 4 after one instruction"
+
+
+def test_assembler_simulator_multiple_instructions(tools):
     """Test assembling and running multiple instructions."""
-    test_data_dir = Path(__file__).parent / "test_data"
-    isa_file = test_data_dir / 'minimal.isa'
-    isa = parse_isa_file(str(isa_file))
-    
-    with tempfile.TemporaryDirectory() as tmpdir:
-        Assembler, Simulator = GeneratorTestHelpers.generate_and_import_both(isa, tmpdir)
-        assembler = Assembler()
-        sim = Simulator()
-        
-        assembly_code = "ADD R1, R0, 10\nSUB R2, R1, 3"
-        machine_code = assembler.assemble(assembly_code)
-        assert len(machine_code) == 2, "Should assemble 2 instructions"
-        
-        sim.load_program(machine_code, start_address=0)
-        assert sim.step() and sim.R[1] == 10 and sim.pc == 4
-        assert sim.step() and sim.R[2] == 7 and sim.pc == 8
-
-
-def test_assembler_binary_output():
+    Simulator, Assembler, _ = tools
+    assembler = Assembler()
+    sim = Simulator()
+
+    assembly_code = "ADD R1, R0, 10\nSUB R2, R1, 3"
+    machine_code = assembler.assemble(assembly_code)
+    assert len(machine_code) == 2, "Should assemble 2 instructions"
+
+    sim.load_program(machine_code, start_address=0)
+    assert sim.step() and sim.R[1] == 10 and sim.pc == 4
+    assert sim.step() and sim.R[2] == 7 and sim.pc == 8
+
+
+def test_assembler_binary_output(tools, tmp_path):
     """Test that assembler can write binary files."""
-    test_data_dir = Path(__file__).parent / "test_data"
-    isa_file = test_data_dir / 'minimal.isa'
-    isa = parse_isa_file(str(isa_file))
-    
-    with tempfile.TemporaryDirectory() as tmpdir:
-        # Generate assembler
-        asm_gen = AssemblerGenerator(isa)
-        asm_file = asm_gen.generate(tmpdir)
-        
-        # Import module
-        asm_spec = importlib.util.spec_from_file_location("assembler", asm_file)
-        asm_module = importlib.util.module_from_spec(asm_spec)
-        asm_spec.loader.exec_module(asm_module)
-        
-        Assembler = asm_module.Assembler
-        
-        # Create assembler and assemble code
-        assembler = Assembler()
-        assembly_code = "ADD R1, R0, 5"
-        machine_code = assembler.assemble(assembly_code)
-        
-        # Write binary file
-        binary_file = Path(tmpdir) / "test.bin"
-        assembler.write_binary(machine_code, str(binary_file))
-        
-        assert binary_file.exists(), "Binary file should be created"
-        assert binary_file.stat().st_size > 0, "Binary file should not be empty"
-        
-        # Verify binary file can be read back
-        with open(binary_file, 'rb') as f:
-            data = f.read()
-            assert len(data) >= 4, "Binary file should contain at least one 32-bit word"
-
-
-def test_simulator_binary_file_loading():
+    _, Assembler, _ = tools
+    # Create assembler and assemble code
+    assembler = Assembler()
+    assembly_code = "ADD R1, R0, 5"
+    machine_code = assembler.assemble(assembly_code)
+
+    # Write binary file
+    binary_file = tmp_path / "test.bin"
+    assembler.write_binary(machine_code, binary_file)
+
+    assert binary_file.exists(), "Binary file should be created"
+    assert binary_file.stat().st_size > 0, "Binary file should not be empty"
+
+    # Verify binary file can be read back
+    data = binary_file.read_bytes()
+    assert len(data) >= 4, "Binary file should contain at least one 32-bit word"
+
+
+def test_simulator_binary_file_loading(tools, tmp_path):
     """Test that simulator can load and execute from binary file."""
-    test_data_dir = Path(__file__).parent / "test_data"
-    isa_file = test_data_dir / 'minimal.isa'
-    isa = parse_isa_file(str(isa_file))
-    
-    with tempfile.TemporaryDirectory() as tmpdir:
-        # Generate tools
-        asm_gen = AssemblerGenerator(isa)
-        asm_file = asm_gen.generate(tmpdir)
-        
-        sim_gen = SimulatorGenerator(isa)
-        sim_file = sim_gen.generate(tmpdir)
-        
-        # Import modules
-        asm_spec = importlib.util.spec_from_file_location("assembler", asm_file)
-        asm_module = importlib.util.module_from_spec(asm_spec)
-        asm_spec.loader.exec_module(asm_module)
-        
-        sim_spec = importlib.util.spec_from_file_location("simulator", sim_file)
-        sim_module = importlib.util.module_from_spec(sim_spec)
-        sim_spec.loader.exec_module(sim_module)
-        
-        Assembler = asm_module.Assembler
-        Simulator = sim_module.Simulator
-        
-        # Assemble code and write binary
-        assembler = Assembler()
-        assembly_code = "ADD R1, R0, 42"
-        machine_code = assembler.assemble(assembly_code)
-        
-        binary_file = Path(tmpdir) / "program.bin"
-        assembler.write_binary(machine_code, str(binary_file))
-        
-        # Load binary into simulator
-        sim = Simulator()
-        sim.load_binary_file(str(binary_file), start_address=0)
-        
-        # Execute
-        assert sim.step(), "Instruction should execute"
-        assert sim.R[1] == 42, f"R[1] should be 42, got {sim.R[1]}"
-
-
-def test_simulator_with_sample_isa():
+    Simulator, Assembler, _ = tools
+    # Assemble code and write binary
+    assembler = Assembler()
+    assembly_code = "ADD R1, R0, 42"
+    machine_code = assembler.assemble(assembly_code)
+
+    binary_file = tmp_path / "program.bin"
+    assembler.write_binary(machine_code, binary_file)
+
+    # Load binary into simulator
+    sim = Simulator()
+    sim.load_binary_file(binary_file, start_address=0)
+
+    # Execute
+    assert sim.step(), "Instruction should execute"
+    assert sim.R[1] == 42, f"R[1] should be 42, got {sim.R[1]}"
+
+
+def test_simulator_with_sample_isa(generated_tools, sample_isa_file):
     """Test simulator with the full sample_isa.isa."""
-    test_data_dir = Path(__file__).parent / "test_data"
-    isa_file = test_data_dir / 'sample_isa.isa'
-    isa = parse_isa_file(str(isa_file))
-    
-    with tempfile.TemporaryDirectory() as tmpdir:
-        Assembler, Simulator = GeneratorTestHelpers.generate_and_import_both(isa, tmpdir)
-        assembler = Assembler()
-        sim = Simulator()
-        
-        machine_code = assembler.assemble("ADD R1, R2, R3")
-        sim.load_program(machine_code, start_address=0)
-        sim.R[2] = 10
-        sim.R[3] = 20
-        
-        assert sim.step(), "ADD instruction should execute"
-        assert sim.R[1] == 30, f"R[1] should be 30 (10 + 20), got {sim.R[1]}"
-
-
-def test_assembler_handles_comments():
+    Simulator, Assembler, _ = generated_tools(sample_isa_file)
+    assembler = Assembler()
+    sim = Simulator()
+
+    machine_code = assembler.assemble("ADD R1, R2, R3")
+    sim.load_program(machine_code, start_address=0)
+    sim.R[2] = 10
+    sim.R[3] = 20
+
+    assert sim.step(), "ADD instruction should execute"
+    assert sim.R[1] == 30, f"R[1] should be 30 (10 + 20), got {sim.R[1]}"
+
+
+def test_assembler_handles_comments(tools):
     """Test that assembler correctly handles comments in assembly code."""
-    test_data_dir = Path(__file__).parent / "test_data"
-    isa_file = test_data_dir / 'minimal.isa'
-    isa = parse_isa_file(str(isa_file))
-    
-    with tempfile.TemporaryDirectory() as tmpdir:
-        # Generate assembler
-        asm_gen = AssemblerGenerator(isa)
-        asm_file = asm_gen.generate(tmpdir)
-        
-        # Import module
-        asm_spec = importlib.util.spec_from_file_location("assembler", asm_file)
-        asm_module = importlib.util.module_from_spec(asm_spec)
-        asm_spec.loader.exec_module(asm_module)
-        
-        Assembler = asm_module.Assembler
-        
-        # Test assembly with comments
-        assembly_code = """# This is a comment
+    _, Assembler, _ = tools
+    # Test assembly with comments
+    assembly_code = """# This is a comment
 ADD R1, R0, 5  # Add 5 to R0 and store in R1
 # Another comment"""
-        
-        assembler = Assembler()
-        machine_code = assembler.assemble(assembly_code)
-        
-        # Should only assemble one instruction (comments should be ignored)
-        assert len(machine_code) == 1, "Should assemble one instruction, ignoring comments"
 
+    assembler = Assembler()
+    machine_code = assembler.assemble(assembly_code)
+
+    # Should only assemble one instruction (comments should be ignored)
+    assert len(machine_code) == 1, "Should assemble one instruction, ignoring comments"
 
-def test_simulator_instruction_counting():
+
+def test_simulator_instruction_counting(tools):
     """Test that simulator correctly counts executed instructions."""
-    test_data_dir = Path(__file__).parent / "test_data"
-    isa_file = test_data_dir / 'minimal.isa'
-    isa = parse_isa_file(str(isa_file))
-    
-    with tempfile.TemporaryDirectory() as tmpdir:
-        # Generate simulator
-        sim_gen = SimulatorGenerator(isa)
-        sim_file = sim_gen.generate(tmpdir)
-        
-        # Import module
-        sim_spec = importlib.util.spec_from_file_location("simulator", sim_file)
-        sim_module = importlib.util.module_from_spec(sim_spec)
-        sim_spec.loader.exec_module(sim_module)
-        
-        Simulator = sim_module.Simulator
-        
-        # Generate assembler too
-        asm_gen = AssemblerGenerator(isa)
-        asm_file = asm_gen.generate(tmpdir)
-        
-        asm_spec = importlib.util.spec_from_file_location("assembler", asm_file)
-        asm_module = importlib.util.module_from_spec(asm_spec)
-        asm_spec.loader.exec_module(asm_module)
-        
-        Assembler = asm_module.Assembler
-        
-        # Create instances
-        assembler = Assembler()
-        sim = Simulator()
-        
-        # Assemble program with 3 instructions
-        assembly_code = """ADD R1, R0, 5
+    Simulator, Assembler, _ = tools
+    # Create instances
+    assembler = Assembler()
+    sim = Simulator()
+
+    # Assemble program with 3 instructions
+    assembly_code = """ADD R1, R0, 5
 ADD R2, R0, 10
 SUB R3, R2, 5"""
-        
-        machine_code = assembler.assemble(assembly_code)
-        sim.load_program(machine_code, start_address=0)
-        
-        # Execute all instructions
-        assert sim.instruction_count == 0, "Instruction count should start at 0"
-        assert sim.step(), "First instruction should execute"
-        assert sim.instruction_count == 1, "Instruction count should be 1"
-        assert sim.step(), "Second instruction should execute"
-        assert sim.instruction_count == 2, "Instruction count should be 2"
-        assert sim.step(), "Third instruction should execute"
-        assert sim.instruction_count == 3, "Instruction count should be 3"
 
+    machine_code = assembler.assemble(assembly_code)
+    sim.load_program(machine_code, start_address=0)
+
+    # Execute all instructions
+    assert sim.instruction_count == 0, "Instruction count should start at 0"
+    assert sim.step(), "First instruction should execute"
+    assert sim.instruction_count == 1, "Instruction count should be 1"
+    assert sim.step(), "Second instruction should execute"
+    assert sim.instruction_count == 2, "Instruction count should be 2"
+    assert sim.step(), "Third instruction should execute"
+    assert sim.instruction_count == 3, "Instruction count should be 3"
+
+
+def test_simulator_run_matches_step(tools):
+    """Test that run() leaves the simulator in the same state as repeated step() calls."""
+    Simulator, Assembler, _ = tools
+    assembler = Assembler()
+    machine_code = assembler.assemble("ADD R1, R0, 5\nADD R2, R1, 10\nSUB R3, R2, 3")
+
+    stepped = Simulator()
+    stepped.load_program(machine_code, start_address=0)
+    while stepped.step():
+        pass
+
+    ran = Simulator()
+    ran.load_program(machine_code, start_address=0)
+    ran.run(max_steps=100)
+
+    assert ran.R == stepped.R, f"Registers differ: run() {ran.R}, step() {stepped.R}"
+    assert ran.pc == stepped.pc and ran.halted == stepped.halted
+    assert ran.instruction_count == stepped.instruction_count == 3
+
+
+def test_simulator_executes_rewritten_memory(tools):
+    """Test that rewriting memory at an executed address runs the new instruction."""
+    Simulator, Assembler, _ = tools
+    assembler = Assembler()
+    sim = Simulator()
+
+    sim.load_program(assembler.assemble("ADD R1, R0, 5"), start_address=0)
+    assert sim.step() and sim.R[1] == 5
+
+    # Same PC, different instruction word: the decoded-instruction cache must not replay ADD 5
+    sim.memory[0] = assembler.assemble("ADD R1, R0, 7")[0]
+    sim.pc = 0
+    assert sim.step() and sim.R[1] == 7, f"R[1] should be 7 after rewriting memory, got {sim.R[1]}"
+
+
+def test_simulator_load_bytes_matches_binary_file(tools, tmp_path):
+    """Test that loading Assembler.to_bytes() output matches loading the written binary file."""
+    Simulator, Assembler, _ = tools
+    assembler = Assembler()
+    machine_code = assembler.assemble("ADD R1, R0, 42\nSUB R2, R1, 2")
+
+    binary_file = tmp_path / "program.bin"
+    assembler.write_binary(machine_code, binary_file)
+    data = assembler.to_bytes(machine_code)
+    assert data == binary_file.read_bytes(), "to_bytes() should return the bytes write_binary() writes"
+
+    from_file = Simulator()
+    from_file.load_binary_file(binary_file, start_address=0)
+    from_bytes = Simulator()
+    from_bytes.load_bytes(data, start_address=0)
+    assert from_bytes.memory == from_file.memory and from_bytes.pc == from_file.pc
+
+
+def test_simulator_dispatches_to_overridden_handlers(tools):
+    """Test that step() and run() call _execute_ methods overridden in a subclass."""
+    Simulator, Assembler, _ = tools
+    calls = []
+
+    class TracingSimulator(Simulator):
+        def _execute_ADD(self, instruction_word):
+            calls.append(instruction_word)
+            super()._execute_ADD(instruction_word)
+
+    machine_code = Assembler().assemble("ADD R1, R0, 5\nADD R2, R1, 10")
+
+    stepped = TracingSimulator()
+    stepped.load_program(machine_code, start_address=0)
+    assert stepped.step() and stepped.R[1] == 5
+    assert calls == machine_code[:1], "step() should call the overridden handler"
+
+    calls.clear()
+    ran = TracingSimulator()
+    ran.load_program(machine_code, start_address=0)
+    ran.run(max_steps=100)
+    assert ran.R[2] == 15
+    assert calls == machine_code, "run() should call the overridden handler"
+
+    # The base class keeps dispatching to its own handlers
+    calls.clear()
+    base = Simulator()
+    base.load_program(machine_code, start_address=0)
+    base.run(max_steps=100)
+    assert base.R[2] == 15 and calls == []
+
+
+def test_simulator_dispatches_to_patched_handlers(tools, monkeypatch):
+    """Test that handlers patched after a simulator has decoded an instruction are called."""
+    Simulator, Assembler, _ = tools
+    machine_code = Assembler().assemble("ADD R1, R0, 5")
+    sim = Simulator()
+    sim.load_program(machine_code, start_address=0)
+    assert sim.step() and sim.R[1] == 5
+
+    calls = []
+    monkeypatch.setattr(Simulator, '_execute_ADD', lambda self, word: calls.append(word))
+    sim.pc = 0
+    assert sim.step()
+    sim.pc = 0
+    sim.run(max_steps=1)
+    assert calls == machine_code * 2, "step() and run() should call the patched handler"
@@ -2,73 +2,94 @@
 
 import pytest
 from pathlib import Path
-import tempfile
 import shutil
-from isa_dsl.model.parser import parse_isa_file
 from isa_dsl.generators.simulator import SimulatorGenerator
 from isa_dsl.generators.assembler import AssemblerGenerator
 from isa_dsl.generators.disassembler import DisassemblerGenerator
 from isa_dsl.generators.documentation import DocumentationGenerator
+from tests.tool_cache import load_isa
 
 
-def test_simulator_generation():
+def test_simulator_generation(tmp_path):
     """Test simulator code generation."""
     test_data_dir = Path(__file__).parent / "test_data"
     isa_file = test_data_dir / 'sample_isa.isa'
-    isa = parse_isa_file(str(isa_file))
+    isa = load_isa(isa_file)
     
-    with tempfile.TemporaryDirectory() as tmpdir:
-        gen = SimulatorGenerator(isa)
-        output_file = gen.generate(tmpdir)
-        
-        assert output_file.exists()
-        code = output_file.read_text()
-        assert 'class Simulator' in code
-        assert 'SimpleRISC' in code
+    gen = SimulatorGenerator(isa)
+    output_file = gen.generate(tmp_path)
+    
+    assert output_file.exists()
+    code = output_file.read_text()
+    assert 'class Simulator' in code
+    assert 'SimpleRISC' in code
 
 
-def test_assembler_generation():
+def test_assembler_generation(tmp_path):
     """Test assembler code generation."""
     test_data_dir = Path(__file__).parent / "test_data"
     isa_file = test_data_dir / 'sample_isa.isa'
-    isa = parse_isa_file(str(isa_file))
+    isa = load_isa(isa_file)
+    
+    gen = AssemblerGenerator(isa)
+    output_file = gen.generate(tmp_path)
     
-    with tempfile.TemporaryDirectory() as tmpdir:
-        gen = AssemblerGenerator(isa)
-        output_file = gen.generate(tmpdir)
-        
-        assert output_file.exists()
-        code = output_file.read_text()
-        assert 'class Assembler' in code
+    assert output_file.exists()
+    code = output_file.read_text()
+    assert 'class Assembler' in code
 
 
-def test_disassembler_generation():
+def test_disassembler_generation(tmp_path):
     """Test disassembler code generation."""
     test_data_dir = Path(__file__).parent / "test_data"
     isa_file = test_data_dir / 'sample_isa.isa'
-    isa = parse_isa_file(str(isa_file))
+    isa = load_isa(isa_file)
+    
+    gen = DisassemblerGenerator(isa)
+    output_file = gen.generate(tmp_path)
+    
+    assert output_file.exists()
+    code = output_file.read_text()
+    assert 'class Disassembler' in code
+
+
+@pytest.mark.parametrize("generator_cls", [SimulatorGenerator, AssemblerGenerator, DisassemblerGenerator])
+def test_render_matches_generated_file(generator_cls, tmp_path):
+    """Test that render() returns the source generate() writes to disk."""
+    test_data_dir = Path(__file__).parent / "test_data"
+    isa = load_isa(test_data_dir / 'sample_isa.isa')
+    
+    gen = generator_cls(isa)
+    output_file = gen.generate(tmp_path)
     
-    with tempfile.TemporaryDirectory() as tmpdir:
-        gen = DisassemblerGenerator(isa)
-        output_file = gen.generate(tmpdir)
-        
-        assert output_file.exists()
-        code = output_file.read_text()
-        assert 'class Disassembler' in code
+    assert gen.render() == output_file.read_text()
 
 
-def test_documentation_generation():
+def test_documentation_generation(tmp_path):
     """Test documentation generation."""
     test_data_dir = Path(__file__).parent / "test_data"
     isa_file = test_data_dir / 'sample_isa.isa'
-    isa = parse_isa_file(str(isa_file))
+    isa = load_isa(isa_file)
     
-    with tempfile.TemporaryDirectory() as tmpdir:
-        gen = DocumentationGenerator(isa)
-        output_file = gen.generate(tmpdir)
-        
-        assert output_file.exists()
-        doc = output_file.read_text()
-        assert 'SimpleRISC' in doc
-        assert 'Instruction Set Architecture' in doc
+    gen = DocumentationGenerator(isa)
+    output_file = gen.generate(tmp_path)
+    
+    assert output_file.exists()
+    doc = output_file.read_text()
+    assert 'SimpleRISC' in doc
+    assert 'Instruction Set Architecture' in doc
+
 
+
+def test_generators_do_not_modify_isa(tmp_path):
+    """Test that generators leave the ISA model unchanged, so a parsed model can be shared."""
+    test_data_dir = Path(__file__).parent / "test_data"
+    isa_file = test_data_dir / 'sample_isa.isa'
+    isa = load_isa(isa_file)
+    before = repr(isa)
+    
+    for generator_class in (SimulatorGenerator, AssemblerGenerator,
+                            DisassemblerGenerator, DocumentationGenerator):
+        generator_class(isa).generate(tmp_path)
+    
+    assert repr(isa) == before, "Generators should not modify the ISA model"
@@ -1,12 +1,11 @@
 """Helper methods for integration tests."""
 
-import tempfile
-import sys
 from pathlib import Path
 
 from isa_dsl.generators.simulator import SimulatorGenerator
 from isa_dsl.generators.assembler import AssemblerGenerator
 from isa_dsl.generators.disassembler import DisassemblerGenerator
+from tests.tool_cache import load_generated_module
 
 
 class IntegrationTestHelpers:
@@ -26,28 +25,30 @@ class IntegrationTestHelpers:
         
         return sim_file, asm_file, disasm_file
     
+    @staticmethod
+    def generate_asm_sim(isa, tmpdir_path):
+        """Generate only the simulator and assembler, for tests that never disassemble."""
+        sim_file = SimulatorGenerator(isa).generate(tmpdir_path)
+        asm_file = AssemblerGenerator(isa).generate(tmpdir_path)
+        return sim_file, asm_file
+    
     @staticmethod
     def import_assembler_simulator(tmpdir_path):
         """Import assembler and simulator from generated files."""
-        sys.path.insert(0, str(tmpdir_path))
-        from assembler import Assembler
-        from simulator import Simulator
+        Assembler = load_generated_module(Path(tmpdir_path) / "assembler.py").Assembler
+        Simulator = load_generated_module(Path(tmpdir_path) / "simulator.py").Simulator
         return Assembler, Simulator
     
     @staticmethod
-    def create_test_assembly_file(tmpdir_path, content):
-        """Create a test assembly file with given content."""
-        asm_source = tmpdir_path / "test.asm"
-        asm_source.write_text(content)
-        return asm_source
+    def import_disassembler(tmpdir_path):
+        """Import disassembler from generated files."""
+        return load_generated_module(Path(tmpdir_path) / "disassembler.py").Disassembler
     
     @staticmethod
-    def assemble_and_write_binary(assembler, asm_source, binary_file):
-        """Assemble code from file and write to binary."""
-        with open(asm_source, 'r') as f:
-            source = f.read()
+    def assemble_and_write_binary_from_string(assembler, source, binary_file):
+        """Assemble code from a source string and write to binary."""
         machine_code = assembler.assemble(source)
-        assembler.write_binary(machine_code, str(binary_file))
+        assembler.write_binary(machine_code, binary_file)
         return machine_code
     
     @staticmethod
@@ -2,22 +2,21 @@
 
 import pytest
 from pathlib import Path
-import tempfile
 import subprocess
 import sys
-from isa_dsl.model.parser import parse_isa_file
 from isa_dsl.model.validator import ISAValidator
 from isa_dsl.generators.simulator import SimulatorGenerator
 from isa_dsl.generators.assembler import AssemblerGenerator
 from isa_dsl.generators.disassembler import DisassemblerGenerator
 from isa_dsl.generators.documentation import DocumentationGenerator
+from tests.tool_cache import load_isa
 
 
-def test_end_to_end_generation():
+def test_end_to_end_generation(tmp_path):
     """Test end-to-end code generation from ISA spec."""
     test_data_dir = Path(__file__).parent / "test_data"
     isa_file = test_data_dir / 'sample_isa.isa'
-    isa = parse_isa_file(str(isa_file))
+    isa = load_isa(isa_file)
     
     # Validate
     validator = ISAValidator(isa)
@@ -25,33 +24,32 @@ def test_end_to_end_generation():
     assert len(errors) == 0
     
     # Generate all tools
-    with tempfile.TemporaryDirectory() as tmpdir:
-        # Simulator
-        sim_gen = SimulatorGenerator(isa)
-        sim_file = sim_gen.generate(tmpdir)
-        assert sim_file.exists()
-        
-        # Assembler
-        asm_gen = AssemblerGenerator(isa)
-        asm_file = asm_gen.generate(tmpdir)
-        assert asm_file.exists()
-        
-        # Disassembler
-        disasm_gen = DisassemblerGenerator(isa)
-        disasm_file = disasm_gen.generate(tmpdir)
-        assert disasm_file.exists()
-        
-        # Documentation
-        doc_gen = DocumentationGenerator(isa)
-        doc_file = doc_gen.generate(tmpdir)
-        assert doc_file.exists()
+    # Simulator
+    sim_gen = SimulatorGenerator(isa)
+    sim_file = sim_gen.generate(tmp_path)
+    assert sim_file.exists()
+    
+    # Assembler
+    asm_gen = AssemblerGenerator(isa)
+    asm_file = asm_gen.generate(tmp_path)
+    assert asm_file.exists()
+    
+    # Disassembler
+    disasm_gen = DisassemblerGenerator(isa)
+    disasm_file = disasm_gen.generate(tmp_path)
+    assert disasm_file.exists()
+    
+    # Documentation
+    doc_gen = DocumentationGenerator(isa)
+    doc_file = doc_gen.generate(tmp_path)
+    assert doc_file.exists()
 
 
 def test_instruction_encoding_decoding():
     """Test that instructions can be encoded and decoded."""
     test_data_dir = Path(__file__).parent / "test_data"
     isa_file = test_data_dir / 'sample_isa.isa'
-    isa = parse_isa_file(str(isa_file))
+    isa = load_isa(isa_file)
     
     add_instr = isa.get_instruction('ADD')
     assert add_instr is not None
@@ -71,3 +69,17 @@ def test_instruction_encoding_decoding():
     # Check that instruction matches its own encoding
     assert add_instr.matches_encoding(encoded)
 
+
+
+def test_instruction_encoding_with_partial_operands():
+    """Test that encoding with a subset of operands matches the full encoding."""
+    test_data_dir = Path(__file__).parent / "test_data"
+    isa_file = test_data_dir / 'sample_isa.isa'
+    isa = load_isa(isa_file)
+    
+    add_instr = isa.get_instruction('ADD')
+    full = add_instr.encode_instruction({'rd': 1, 'rs1': 2, 'rs2': 0})
+    partial = add_instr.encode_instruction({'rd': 1, 'rs1': 2})
+    
+    assert partial == full
+    assert add_instr.decode_operands(partial) == {'rd': 1, 'rs1': 2, 'rs2': 0}
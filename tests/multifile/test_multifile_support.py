@@ -1,7 +1,6 @@
 """Tests for multi-file ISA DSL support."""
 
 import pytest
-import tempfile
 from pathlib import Path
 from isa_dsl.model.parser import parse_isa_file
 
@@ -18,10 +17,9 @@ TEST_DATA_DIR = Path(__file__).parent / "test_data"
 
 
 @pytest.fixture
-def temp_dir():
+def temp_dir(tmp_path):
     """Create a temporary directory for test files."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        yield Path(tmpdir)
+    yield Path(tmp_path)
 
 
 class TestCommentSupport:
@@ -1,11 +1,9 @@
 """Tests for new built-in functions: ssov, suov, carry, borrow, reverse16, leading_ones, leading_zeros, leading_signs."""
 
 import pytest
-import tempfile
-import sys
 from pathlib import Path
 
-from isa_dsl.model.parser import parse_isa_file
+from tests.tool_cache import load_generated_module, load_isa
 from isa_dsl.runtime.rtl_interpreter import RTLInterpreter
 from isa_dsl.model.isa_model import RTLFunctionCall, RTLConstant
 from isa_dsl.generators.simulator import SimulatorGenerator
@@ -167,665 +165,497 @@ def test_rtl_interpreter_leading_signs():
     assert result == 1, f"Expected 1, got {result}"
 
 
-def test_ssov_32_positive_overflow(builtins_isa_file):
+def test_ssov_32_positive_overflow(builtins_isa_file, tmp_path):
     """Test ssov with 32-bit positive overflow in simulator"""
-    isa = parse_isa_file(str(builtins_isa_file))
-    
-    with tempfile.TemporaryDirectory() as tmpdir:
-        tmpdir_path = Path(tmpdir)
-        
-        sim_gen = SimulatorGenerator(isa)
-        sim_file = sim_gen.generate(tmpdir_path)
-        
-        asm_gen = AssemblerGenerator(isa)
-        asm_file = asm_gen.generate(tmpdir_path)
-        
-        sys.path.insert(0, str(tmpdir_path))
-        try:
-            import importlib.util
-            sim_spec = importlib.util.spec_from_file_location("simulator", sim_file)
-            sim_module = importlib.util.module_from_spec(sim_spec)
-            sim_spec.loader.exec_module(sim_module)
-            Simulator = sim_module.Simulator
-            
-            asm_spec = importlib.util.spec_from_file_location("assembler", asm_file)
-            asm_module = importlib.util.module_from_spec(asm_spec)
-            asm_spec.loader.exec_module(asm_module)
-            Assembler = asm_module.Assembler
-            
-            assembler = Assembler()
-            sim = Simulator()
-            
-            # Test: ssov with value that would overflow (0x80000000 = 2147483648 > 0x7FFFFFFF)
-            assembly_code = "SSOV_32 R0, R1"
-            machine_code = assembler.assemble(assembly_code)
-            
-            binary_file = tmpdir_path / "test.bin"
-            with open(binary_file, 'wb') as f:
-                for word in machine_code:
-                    f.write(word.to_bytes(4, byteorder='little'))
-            
-            sim.load_binary_file(str(binary_file), start_address=0)
-            sim.R[1] = 0x80000000  # This should saturate to 0x7FFFFFFF
-            sim.R[0] = 0
-            
-            executed = sim.step()
-            assert executed, "Instruction should execute successfully"
-            
-            # ssov(0x80000000, 32) should saturate to 0x7FFFFFFF (max signed 32-bit)
-            expected = 0x7FFFFFFF
-            assert sim.R[0] == expected, f"Expected {expected:08x}, got {sim.R[0]:08x}"
-            
-            # Test: ssov with value in range (0x7FFFFFFF should remain unchanged)
-            sim.R[1] = 0x7FFFFFFF
-            sim.R[0] = 0
-            sim.pc = 0
-            
-            executed = sim.step()
-            assert executed, "Instruction should execute successfully"
-            
-            expected = 0x7FFFFFFF
-            assert sim.R[0] == expected, f"Expected {expected:08x}, got {sim.R[0]:08x}"
-            
-        finally:
-            if str(tmpdir_path) in sys.path:
-                sys.path.remove(str(tmpdir_path))
-
-
-def test_ssov_16(builtins_isa_file):
+    isa = load_isa(builtins_isa_file)
+    
+    sim_gen = SimulatorGenerator(isa)
+    sim_file = sim_gen.generate(tmp_path)
+    
+    asm_gen = AssemblerGenerator(isa)
+    asm_file = asm_gen.generate(tmp_path)
+    
+    sim_module = load_generated_module(sim_file)
+    Simulator = sim_module.Simulator
+    
+    asm_module = load_generated_module(asm_file)
+    Assembler = asm_module.Assembler
+    
+    assembler = Assembler()
+    sim = Simulator()
+    
+    # Test: ssov with value that would overflow (0x80000000 = 2147483648 > 0x7FFFFFFF)
+    assembly_code = "SSOV_32 R0, R1"
+    machine_code = assembler.assemble(assembly_code)
+    
+    binary_file = tmp_path / "test.bin"
+    with open(binary_file, 'wb') as f:
+        for word in machine_code:
+            f.write(word.to_bytes(4, byteorder='little'))
+    
+    sim.load_binary_file(binary_file, start_address=0)
+    sim.R[1] = 0x80000000  # This should saturate to 0x7FFFFFFF
+    sim.R[0] = 0
+    
+    executed = sim.step()
+    assert executed, "Instruction should execute successfully"
+    
+    # ssov(0x80000000, 32) should saturate to 0x7FFFFFFF (max signed 32-bit)
+    expected = 0x7FFFFFFF
+    assert sim.R[0] == expected, f"Expected {expected:08x}, got {sim.R[0]:08x}"
+    
+    # Test: ssov with value in range (0x7FFFFFFF should remain unchanged)
+    sim.R[1] = 0x7FFFFFFF
+    sim.R[0] = 0
+    sim.pc = 0
+    
+    executed = sim.step()
+    assert executed, "Instruction should execute successfully"
+    
+    expected = 0x7FFFFFFF
+    assert sim.R[0] == expected, f"Expected {expected:08x}, got {sim.R[0]:08x}"
+
+
+def test_ssov_16(builtins_isa_file, tmp_path):
     """Test ssov with 16-bit width in simulator"""
-    isa = parse_isa_file(str(builtins_isa_file))
-    
-    with tempfile.TemporaryDirectory() as tmpdir:
-        tmpdir_path = Path(tmpdir)
-        
-        sim_gen = SimulatorGenerator(isa)
-        sim_file = sim_gen.generate(tmpdir_path)
-        
-        asm_gen = AssemblerGenerator(isa)
-        asm_file = asm_gen.generate(tmpdir_path)
-        
-        sys.path.insert(0, str(tmpdir_path))
-        try:
-            import importlib.util
-            sim_spec = importlib.util.spec_from_file_location("simulator", sim_file)
-            sim_module = importlib.util.module_from_spec(sim_spec)
-            sim_spec.loader.exec_module(sim_module)
-            Simulator = sim_module.Simulator
-            
-            asm_spec = importlib.util.spec_from_file_location("assembler", asm_file)
-            asm_module = importlib.util.module_from_spec(asm_spec)
-            asm_spec.loader.exec_module(asm_module)
-            Assembler = asm_module.Assembler
-            
-            assembler = Assembler()
-            sim = Simulator()
-            
-            # Test: ssov with 16-bit positive overflow (0x8000 should saturate to 0x7FFF)
-            assembly_code = "SSOV_16 R0, R1"
-            machine_code = assembler.assemble(assembly_code)
-            
-            binary_file = tmpdir_path / "test.bin"
-            with open(binary_file, 'wb') as f:
-                for word in machine_code:
-                    f.write(word.to_bytes(4, byteorder='little'))
-            
-            sim.load_binary_file(str(binary_file), start_address=0)
-            sim.R[1] = 0x8000  # Should saturate to 0x7FFF for 16-bit
-            sim.R[0] = 0
-            
-            executed = sim.step()
-            assert executed, "Instruction should execute successfully"
-            
-            # ssov(0x8000, 16) should saturate to 0x7FFF (max signed 16-bit)
-            expected = 0x7FFF
-            assert sim.R[0] == expected, f"Expected {expected:08x}, got {sim.R[0]:08x}"
-            
-        finally:
-            if str(tmpdir_path) in sys.path:
-                sys.path.remove(str(tmpdir_path))
-
-
-def test_suov_32(builtins_isa_file):
+    isa = load_isa(builtins_isa_file)
+    
+    sim_gen = SimulatorGenerator(isa)
+    sim_file = sim_gen.generate(tmp_path)
+    
+    asm_gen = AssemblerGenerator(isa)
+    asm_file = asm_gen.generate(tmp_path)
+    
+    sim_module = load_generated_module(sim_file)
+    Simulator = sim_module.Simulator
+    
+    asm_module = load_generated_module(asm_file)
+    Assembler = asm_module.Assembler
+    
+    assembler = Assembler()
+    sim = Simulator()
+    
+    # Test: ssov with 16-bit positive overflow (0x8000 should saturate to 0x7FFF)
+    assembly_code = "SSOV_16 R0, R1"
+    machine_code = assembler.assemble(assembly_code)
+    
+    binary_file = tmp_path / "test.bin"
+    with open(binary_file, 'wb') as f:
+        for word in machine_code:
+            f.write(word.to_bytes(4, byteorder='little'))
+    
+    sim.load_binary_file(binary_file, start_address=0)
+    sim.R[1] = 0x8000  # Should saturate to 0x7FFF for 16-bit
+    sim.R[0] = 0
+    
+    executed = sim.step()
+    assert executed, "Instruction should execute successfully"
+    
+    # ssov(0x8000, 16) should saturate to 0x7FFF (max signed 16-bit)
+    expected = 0x7FFF
+    assert sim.R[0] == expected, f"Expected {expected:08x}, got {sim.R[0]:08x}"
+
+
+def test_suov_32(builtins_isa_file, tmp_path):
     """Test suov with 32-bit unsigned saturation in simulator"""
-    isa = parse_isa_file(str(builtins_isa_file))
-    
-    with tempfile.TemporaryDirectory() as tmpdir:
-        tmpdir_path = Path(tmpdir)
-        
-        sim_gen = SimulatorGenerator(isa)
-        sim_file = sim_gen.generate(tmpdir_path)
-        
-        asm_gen = AssemblerGenerator(isa)
-        asm_file = asm_gen.generate(tmpdir_path)
-        
-        sys.path.insert(0, str(tmpdir_path))
-        try:
-            import importlib.util
-            sim_spec = importlib.util.spec_from_file_location("simulator", sim_file)
-            sim_module = importlib.util.module_from_spec(sim_spec)
-            sim_spec.loader.exec_module(sim_module)
-            Simulator = sim_module.Simulator
-            
-            asm_spec = importlib.util.spec_from_file_location("assembler", asm_file)
-            asm_module = importlib.util.module_from_spec(asm_spec)
-            asm_spec.loader.exec_module(asm_module)
-            Assembler = asm_module.Assembler
-            
-            assembler = Assembler()
-            sim = Simulator()
-            
-            # Test: suov with max unsigned 32-bit value
-            assembly_code = "SUOV_32 R0, R1"
-            machine_code = assembler.assemble(assembly_code)
-            
-            binary_file = tmpdir_path / "test.bin"
-            with open(binary_file, 'wb') as f:
-                for word in machine_code:
-                    f.write(word.to_bytes(4, byteorder='little'))
-            
-            sim.load_binary_file(str(binary_file), start_address=0)
-            sim.R[1] = 0xFFFFFFFF  # Max unsigned 32-bit value
-            sim.R[0] = 0
-            
-            executed = sim.step()
-            assert executed, "Instruction should execute successfully"
-            
-            # suov(0xFFFFFFFF, 32) should remain 0xFFFFFFFF (max unsigned 32-bit)
-            expected = 0xFFFFFFFF
-            assert sim.R[0] == expected, f"Expected {expected:08x}, got {sim.R[0]:08x}"
-            
-        finally:
-            if str(tmpdir_path) in sys.path:
-                sys.path.remove(str(tmpdir_path))
-
-
-def test_suov_16(builtins_isa_file):
+    isa = load_isa(builtins_isa_file)
+    
+    sim_gen = SimulatorGenerator(isa)
+    sim_file = sim_gen.generate(tmp_path)
+    
+    asm_gen = AssemblerGenerator(isa)
+    asm_file = asm_gen.generate(tmp_path)
+    
+    sim_module = load_generated_module(sim_file)
+    Simulator = sim_module.Simulator
+    
+    asm_module = load_generated_module(asm_file)
+    Assembler = asm_module.Assembler
+    
+    assembler = Assembler()
+    sim = Simulator()
+    
+    # Test: suov with max unsigned 32-bit value
+    assembly_code = "SUOV_32 R0, R1"
+    machine_code = assembler.assemble(assembly_code)
+    
+    binary_file = tmp_path / "test.bin"
+    with open(binary_file, 'wb') as f:
+        for word in machine_code:
+            f.write(word.to_bytes(4, byteorder='little'))
+    
+    sim.load_binary_file(binary_file, start_address=0)
+    sim.R[1] = 0xFFFFFFFF  # Max unsigned 32-bit value
+    sim.R[0] = 0
+    
+    executed = sim.step()
+    assert executed, "Instruction should execute successfully"
+    
+    # suov(0xFFFFFFFF, 32) should remain 0xFFFFFFFF (max unsigned 32-bit)
+    expected = 0xFFFFFFFF
+    assert sim.R[0] == expected, f"Expected {expected:08x}, got {sim.R[0]:08x}"
+
+
+def test_suov_16(builtins_isa_file, tmp_path):
     """Test suov with 16-bit unsigned saturation in simulator"""
-    isa = parse_isa_file(str(builtins_isa_file))
-    
-    with tempfile.TemporaryDirectory() as tmpdir:
-        tmpdir_path = Path(tmpdir)
-        
-        sim_gen = SimulatorGenerator(isa)
-        sim_file = sim_gen.generate(tmpdir_path)
-        
-        asm_gen = AssemblerGenerator(isa)
-        asm_file = asm_gen.generate(tmpdir_path)
-        
-        sys.path.insert(0, str(tmpdir_path))
-        try:
-            import importlib.util
-            sim_spec = importlib.util.spec_from_file_location("simulator", sim_file)
-            sim_module = importlib.util.module_from_spec(sim_spec)
-            sim_spec.loader.exec_module(sim_module)
-            Simulator = sim_module.Simulator
-            
-            asm_spec = importlib.util.spec_from_file_location("assembler", asm_file)
-            asm_module = importlib.util.module_from_spec(asm_spec)
-            asm_spec.loader.exec_module(asm_module)
-            Assembler = asm_module.Assembler
-            
-            assembler = Assembler()
-            sim = Simulator()
-            
-            # Test: suov with value that exceeds 16-bit unsigned max
-            assembly_code = "SUOV_16 R0, R1"
-            machine_code = assembler.assemble(assembly_code)
-            
-            binary_file = tmpdir_path / "test.bin"
-            with open(binary_file, 'wb') as f:
-                for word in machine_code:
-                    f.write(word.to_bytes(4, byteorder='little'))
-            
-            sim.load_binary_file(str(binary_file), start_address=0)
-            sim.R[1] = 0x10000  # Exceeds 16-bit max (0xFFFF), should saturate to 0xFFFF
-            sim.R[0] = 0
-            
-            executed = sim.step()
-            assert executed, "Instruction should execute successfully"
-            
-            # suov(0x10000, 16) should saturate to 0xFFFF (max unsigned 16-bit)
-            expected = 0xFFFF
-            assert sim.R[0] == expected, f"Expected {expected:08x}, got {sim.R[0]:08x}"
-            
-        finally:
-            if str(tmpdir_path) in sys.path:
-                sys.path.remove(str(tmpdir_path))
-
-
-def test_carry(builtins_isa_file):
+    isa = load_isa(builtins_isa_file)
+    
+    sim_gen = SimulatorGenerator(isa)
+    sim_file = sim_gen.generate(tmp_path)
+    
+    asm_gen = AssemblerGenerator(isa)
+    asm_file = asm_gen.generate(tmp_path)
+    
+    sim_module = load_generated_module(sim_file)
+    Simulator = sim_module.Simulator
+    
+    asm_module = load_generated_module(asm_file)
+    Assembler = asm_module.Assembler
+    
+    assembler = Assembler()
+    sim = Simulator()
+    
+    # Test: suov with value that exceeds 16-bit unsigned max
+    assembly_code = "SUOV_16 R0, R1"
+    machine_code = assembler.assemble(assembly_code)
+    
+    binary_file = tmp_path / "test.bin"
+    with open(binary_file, 'wb') as f:
+        for word in machine_code:
+            f.write(word.to_bytes(4, byteorder='little'))
+    
+    sim.load_binary_file(binary_file, start_address=0)
+    sim.R[1] = 0x10000  # Exceeds 16-bit max (0xFFFF), should saturate to 0xFFFF
+    sim.R[0] = 0
+    
+    executed = sim.step()
+    assert executed, "Instruction should execute successfully"
+    
+    # suov(0x10000, 16) should saturate to 0xFFFF (max unsigned 16-bit)
+    expected = 0xFFFF
+    assert sim.R[0] == expected, f"Expected {expected:08x}, got {sim.R[0]:08x}"
+
+
+def test_carry(builtins_isa_file, tmp_path):
     """Test carry function in simulator"""
-    isa = parse_isa_file(str(builtins_isa_file))
-    
-    with tempfile.TemporaryDirectory() as tmpdir:
-        tmpdir_path = Path(tmpdir)
-        
-        sim_gen = SimulatorGenerator(isa)
-        sim_file = sim_gen.generate(tmpdir_path)
-        
-        asm_gen = AssemblerGenerator(isa)
-        asm_file = asm_gen.generate(tmpdir_path)
-        
-        sys.path.insert(0, str(tmpdir_path))
-        try:
-            import importlib.util
-            sim_spec = importlib.util.spec_from_file_location("simulator", sim_file)
-            sim_module = importlib.util.module_from_spec(sim_spec)
-            sim_spec.loader.exec_module(sim_module)
-            Simulator = sim_module.Simulator
-            
-            asm_spec = importlib.util.spec_from_file_location("assembler", asm_file)
-            asm_module = importlib.util.module_from_spec(asm_spec)
-            asm_spec.loader.exec_module(asm_module)
-            Assembler = asm_module.Assembler
-            
-            assembler = Assembler()
-            sim = Simulator()
-            
-            # Test: carry with values that produce carry (0xFFFFFFFF + 1 = overflow)
-            assembly_code = "CARRY R0, R1, R2"
-            machine_code = assembler.assemble(assembly_code)
-            
-            binary_file = tmpdir_path / "test.bin"
-            with open(binary_file, 'wb') as f:
-                for word in machine_code:
-                    f.write(word.to_bytes(4, byteorder='little'))
-            
-            sim.load_binary_file(str(binary_file), start_address=0)
-            sim.R[1] = 0xFFFFFFFF
-            sim.R[2] = 1
-            sim.R[0] = 0
-            
-            executed = sim.step()
-            assert executed, "Instruction should execute successfully"
-            
-            # carry(0xFFFFFFFF, 1, 0) should return 1 (carry occurs)
-            expected = 1
-            assert sim.R[0] == expected, f"Expected {expected}, got {sim.R[0]}"
-            
-        finally:
-            if str(tmpdir_path) in sys.path:
-                sys.path.remove(str(tmpdir_path))
-
-
-def test_carry_with_cin(builtins_isa_file):
+    isa = load_isa(builtins_isa_file)
+    
+    sim_gen = SimulatorGenerator(isa)
+    sim_file = sim_gen.generate(tmp_path)
+    
+    asm_gen = AssemblerGenerator(isa)
+    asm_file = asm_gen.generate(tmp_path)
+    
+    sim_module = load_generated_module(sim_file)
+    Simulator = sim_module.Simulator
+    
+    asm_module = load_generated_module(asm_file)
+    Assembler = asm_module.Assembler
+    
+    assembler = Assembler()
+    sim = Simulator()
+    
+    # Test: carry with values that produce carry (0xFFFFFFFF + 1 = overflow)
+    assembly_code = "CARRY R0, R1, R2"
+    machine_code = assembler.assemble(assembly_code)
+    
+    binary_file = tmp_path / "test.bin"
+    with open(binary_file, 'wb') as f:
+        for word in machine_code:
+            f.write(word.to_bytes(4, byteorder='little'))
+    
+    sim.load_binary_file(binary_file, start_address=0)
+    sim.R[1] = 0xFFFFFFFF
+    sim.R[2] = 1
+    sim.R[0] = 0
+    
+    executed = sim.step()
+    assert executed, "Instruction should execute successfully"
+    
+    # carry(0xFFFFFFFF, 1, 0) should return 1 (carry occurs)
+    expected = 1
+    assert sim.R[0] == expected, f"Expected {expected}, got {sim.R[0]}"
+
+
+def test_carry_with_cin(builtins_isa_file, tmp_path):
     """Test carry function with carry_in in simulator"""
-    isa = parse_isa_file(str(builtins_isa_file))
-    
-    with tempfile.TemporaryDirectory() as tmpdir:
-        tmpdir_path = Path(tmpdir)
-        
-        sim_gen = SimulatorGenerator(isa)
-        sim_file = sim_gen.generate(tmpdir_path)
-        
-        asm_gen = AssemblerGenerator(isa)
-        asm_file = asm_gen.generate(tmpdir_path)
-        
-        sys.path.insert(0, str(tmpdir_path))
-        try:
-            import importlib.util
-            sim_spec = importlib.util.spec_from_file_location("simulator", sim_file)
-            sim_module = importlib.util.module_from_spec(sim_spec)
-            sim_spec.loader.exec_module(sim_module)
-            Simulator = sim_module.Simulator
-            
-            asm_spec = importlib.util.spec_from_file_location("assembler", asm_file)
-            asm_module = importlib.util.module_from_spec(asm_spec)
-            asm_spec.loader.exec_module(asm_module)
-            Assembler = asm_module.Assembler
-            
-            assembler = Assembler()
-            sim = Simulator()
-            
-            # Test: carry with carry_in = 1
-            assembly_code = "CARRY_WITH_CIN R0, R1, R2"
-            machine_code = assembler.assemble(assembly_code)
-            
-            binary_file = tmpdir_path / "test.bin"
-            with open(binary_file, 'wb') as f:
-                for word in machine_code:
-                    f.write(word.to_bytes(4, byteorder='little'))
-            
-            sim.load_binary_file(str(binary_file), start_address=0)
-            sim.R[1] = 0xFFFFFFFF
-            sim.R[2] = 0
-            sim.R[0] = 0
-            
-            executed = sim.step()
-            assert executed, "Instruction should execute successfully"
-            
-            # carry(0xFFFFFFFF, 0, 1) should return 1 (carry occurs: 0xFFFFFFFF + 0 + 1 = 0x100000000)
-            expected = 1
-            assert sim.R[0] == expected, f"Expected {expected}, got {sim.R[0]}"
-            
-        finally:
-            if str(tmpdir_path) in sys.path:
-                sys.path.remove(str(tmpdir_path))
-
-
-def test_borrow(builtins_isa_file):
+    isa = load_isa(builtins_isa_file)
+    
+    sim_gen = SimulatorGenerator(isa)
+    sim_file = sim_gen.generate(tmp_path)
+    
+    asm_gen = AssemblerGenerator(isa)
+    asm_file = asm_gen.generate(tmp_path)
+    
+    sim_module = load_generated_module(sim_file)
+    Simulator = sim_module.Simulator
+    
+    asm_module = load_generated_module(asm_file)
+    Assembler = asm_module.Assembler
+    
+    assembler = Assembler()
+    sim = Simulator()
+    
+    # Test: carry with carry_in = 1
+    assembly_code = "CARRY_WITH_CIN R0, R1, R2"
+    machine_code = assembler.assemble(assembly_code)
+    
+    binary_file = tmp_path / "test.bin"
+    with open(binary_file, 'wb') as f:
+        for word in machine_code:
+            f.write(word.to_bytes(4, byteorder='little'))
+    
+    sim.load_binary_file(binary_file, start_address=0)
+    sim.R[1] = 0xFFFFFFFF
+    sim.R[2] = 0
+    sim.R[0] = 0
+    
+    executed = sim.step()
+    assert executed, "Instruction should execute successfully"
+    
+    # carry(0xFFFFFFFF, 0, 1) should return 1 (carry occurs: 0xFFFFFFFF + 0 + 1 = 0x100000000)
+    expected = 1
+    assert sim.R[0] == expected, f"Expected {expected}, got {sim.R[0]}"
+
+
+def test_borrow(builtins_isa_file, tmp_path):
     """Test borrow function in simulator"""
-    isa = parse_isa_file(str(builtins_isa_file))
-    
-    with tempfile.TemporaryDirectory() as tmpdir:
-        tmpdir_path = Path(tmpdir)
-        
-        sim_gen = SimulatorGenerator(isa)
-        sim_file = sim_gen.generate(tmpdir_path)
-        
-        asm_gen = AssemblerGenerator(isa)
-        asm_file = asm_gen.generate(tmpdir_path)
-        
-        sys.path.insert(0, str(tmpdir_path))
-        try:
-            import importlib.util
-            sim_spec = importlib.util.spec_from_file_location("simulator", sim_file)
-            sim_module = importlib.util.module_from_spec(sim_spec)
-            sim_spec.loader.exec_module(sim_module)
-            Simulator = sim_module.Simulator
-            
-            asm_spec = importlib.util.spec_from_file_location("assembler", asm_file)
-            asm_module = importlib.util.module_from_spec(asm_spec)
-            asm_spec.loader.exec_module(asm_module)
-            Assembler = asm_module.Assembler
-            
-            assembler = Assembler()
-            sim = Simulator()
-            
-            # Test: borrow when operand1 < operand2 (0 < 1 should borrow)
-            assembly_code = "BORROW R0, R1, R2"
-            machine_code = assembler.assemble(assembly_code)
-            
-            binary_file = tmpdir_path / "test.bin"
-            with open(binary_file, 'wb') as f:
-                for word in machine_code:
-                    f.write(word.to_bytes(4, byteorder='little'))
-            
-            sim.load_binary_file(str(binary_file), start_address=0)
-            sim.R[1] = 0
-            sim.R[2] = 1
-            sim.R[0] = 0
-            
-            executed = sim.step()
-            assert executed, "Instruction should execute successfully"
-            
-            # borrow(0, 1, 0) should return 1 (borrow occurs: 0 < 1)
-            expected = 1
-            assert sim.R[0] == expected, f"Expected {expected}, got {sim.R[0]}"
-            
-        finally:
-            if str(tmpdir_path) in sys.path:
-                sys.path.remove(str(tmpdir_path))
-
-
-def test_borrow_with_bin(builtins_isa_file):
+    isa = load_isa(builtins_isa_file)
+    
+    sim_gen = SimulatorGenerator(isa)
+    sim_file = sim_gen.generate(tmp_path)
+    
+    asm_gen = AssemblerGenerator(isa)
+    asm_file = asm_gen.generate(tmp_path)
+    
+    sim_module = load_generated_module(sim_file)
+    Simulator = sim_module.Simulator
+    
+    asm_module = load_generated_module(asm_file)
+    Assembler = asm_module.Assembler
+    
+    assembler = Assembler()
+    sim = Simulator()
+    
+    # Test: borrow when operand1 < operand2 (0 < 1 should borrow)
+    assembly_code = "BORROW R0, R1, R2"
+    machine_code = assembler.assemble(assembly_code)
+    
+    binary_file = tmp_path / "test.bin"
+    with open(binary_file, 'wb') as f:
+        for word in machine_code:
+            f.write(word.to_bytes(4, byteorder='little'))
+    
+    sim.load_binary_file(binary_file, start_address=0)
+    sim.R[1] = 0
+    sim.R[2] = 1
+    sim.R[0] = 0
+    
+    executed = sim.step()
+    assert executed, "Instruction should execute successfully"
+    
+    # borrow(0, 1, 0) should return 1 (borrow occurs: 0 < 1)
+    expected = 1
+    assert sim.R[0] == expected, f"Expected {expected}, got {sim.R[0]}"
+
+
+def test_borrow_with_bin(builtins_isa_file, tmp_path):
     """Test borrow function with borrow_in in simulator"""
-    isa = parse_isa_file(str(builtins_isa_file))
-    
-    with tempfile.TemporaryDirectory() as tmpdir:
-        tmpdir_path = Path(tmpdir)
-        
-        sim_gen = SimulatorGenerator(isa)
-        sim_file = sim_gen.generate(tmpdir_path)
-        
-        asm_gen = AssemblerGenerator(isa)
-        asm_file = asm_gen.generate(tmpdir_path)
-        
-        sys.path.insert(0, str(tmpdir_path))
-        try:
-            import importlib.util
-            sim_spec = importlib.util.spec_from_file_location("simulator", sim_file)
-            sim_module = importlib.util.module_from_spec(sim_spec)
-            sim_spec.loader.exec_module(sim_module)
-            Simulator = sim_module.Simulator
-            
-            asm_spec = importlib.util.spec_from_file_location("assembler", asm_file)
-            asm_module = importlib.util.module_from_spec(asm_spec)
-            asm_spec.loader.exec_module(asm_module)
-            Assembler = asm_module.Assembler
-            
-            assembler = Assembler()
-            sim = Simulator()
-            
-            # Test: borrow with borrow_in = 1
-            assembly_code = "BORROW_WITH_BIN R0, R1, R2"
-            machine_code = assembler.assemble(assembly_code)
-            
-            binary_file = tmpdir_path / "test.bin"
-            with open(binary_file, 'wb') as f:
-                for word in machine_code:
-                    f.write(word.to_bytes(4, byteorder='little'))
-            
-            sim.load_binary_file(str(binary_file), start_address=0)
-            sim.R[1] = 1
-            sim.R[2] = 1
-            sim.R[0] = 0
-            
-            executed = sim.step()
-            assert executed, "Instruction should execute successfully"
-            
-            # borrow(1, 1, 1) should return 1 (borrow occurs: 1 < (1 + 1))
-            expected = 1
-            assert sim.R[0] == expected, f"Expected {expected}, got {sim.R[0]}"
-            
-        finally:
-            if str(tmpdir_path) in sys.path:
-                sys.path.remove(str(tmpdir_path))
-
-
-def test_reverse16(builtins_isa_file):
+    isa = load_isa(builtins_isa_file)
+    
+    sim_gen = SimulatorGenerator(isa)
+    sim_file = sim_gen.generate(tmp_path)
+    
+    asm_gen = AssemblerGenerator(isa)
+    asm_file = asm_gen.generate(tmp_path)
+    
+    sim_module = load_generated_module(sim_file)
+    Simulator = sim_module.Simulator
+    
+    asm_module = load_generated_module(asm_file)
+    Assembler = asm_module.Assembler
+    
+    assembler = Assembler()
+    sim = Simulator()
+    
+    # Test: borrow with borrow_in = 1
+    assembly_code = "BORROW_WITH_BIN R0, R1, R2"
+    machine_code = assembler.assemble(assembly_code)
+    
+    binary_file = tmp_path / "test.bin"
+    with open(binary_file, 'wb') as f:
+        for word in machine_code:
+            f.write(word.to_bytes(4, byteorder='little'))
+    
+    sim.load_binary_file(binary_file, start_address=0)
+    sim.R[1] = 1
+    sim.R[2] = 1
+    sim.R[0] = 0
+    
+    executed = sim.step()
+    assert executed, "Instruction should execute successfully"
+    
+    # borrow(1, 1, 1) should return 1 (borrow occurs: 1 < (1 + 1))
+    expected = 1
+    assert sim.R[0] == expected, f"Expected {expected}, got {sim.R[0]}"
+
+
+def test_reverse16(builtins_isa_file, tmp_path):
     """Test reverse16 function in simulator"""
-    isa = parse_isa_file(str(builtins_isa_file))
-    
-    with tempfile.TemporaryDirectory() as tmpdir:
-        tmpdir_path = Path(tmpdir)
-        
-        sim_gen = SimulatorGenerator(isa)
-        sim_file = sim_gen.generate(tmpdir_path)
-        
-        asm_gen = AssemblerGenerator(isa)
-        asm_file = asm_gen.generate(tmpdir_path)
-        
-        sys.path.insert(0, str(tmpdir_path))
-        try:
-            import importlib.util
-            sim_spec = importlib.util.spec_from_file_location("simulator", sim_file)
-            sim_module = importlib.util.module_from_spec(sim_spec)
-            sim_spec.loader.exec_module(sim_module)
-            Simulator = sim_module.Simulator
-            
-            asm_spec = importlib.util.spec_from_file_location("assembler", asm_file)
-            asm_module = importlib.util.module_from_spec(asm_spec)
-            asm_spec.loader.exec_module(asm_module)
-            Assembler = asm_module.Assembler
-            
-            assembler = Assembler()
-            sim = Simulator()
-            
-            # Test: reverse16 with 0x1234
-            assembly_code = "REVERSE16 R0, R1"
-            machine_code = assembler.assemble(assembly_code)
-            
-            binary_file = tmpdir_path / "test.bin"
-            with open(binary_file, 'wb') as f:
-                for word in machine_code:
-                    f.write(word.to_bytes(4, byteorder='little'))
-            
-            sim.load_binary_file(str(binary_file), start_address=0)
-            sim.R[1] = 0x1234
-            sim.R[0] = 0
-            
-            executed = sim.step()
-            assert executed, "Instruction should execute successfully"
-            
-            # reverse16(0x1234) should return 0x2C48
-            expected = 0x2C48
-            assert sim.R[0] == expected, f"Expected {expected:04x}, got {sim.R[0]:04x}"
-            
-        finally:
-            if str(tmpdir_path) in sys.path:
-                sys.path.remove(str(tmpdir_path))
-
-
-def test_leading_ones(builtins_isa_file):
+    isa = load_isa(builtins_isa_file)
+    
+    sim_gen = SimulatorGenerator(isa)
+    sim_file = sim_gen.generate(tmp_path)
+    
+    asm_gen = AssemblerGenerator(isa)
+    asm_file = asm_gen.generate(tmp_path)
+    
+    sim_module = load_generated_module(sim_file)
+    Simulator = sim_module.Simulator
+    
+    asm_module = load_generated_module(asm_file)
+    Assembler = asm_module.Assembler
+    
+    assembler = Assembler()
+    sim = Simulator()
+    
+    # Test: reverse16 with 0x1234
+    assembly_code = "REVERSE16 R0, R1"
+    machine_code = assembler.assemble(assembly_code)
+    
+    binary_file = tmp_path / "test.bin"
+    with open(binary_file, 'wb') as f:
+        for word in machine_code:
+            f.write(word.to_bytes(4, byteorder='little'))
+    
+    sim.load_binary_file(binary_file, start_address=0)
+    sim.R[1] = 0x1234
+    sim.R[0] = 0
+    
+    executed = sim.step()
+    assert executed, "Instruction should execute successfully"
+    
+    # reverse16(0x1234) should return 0x2C48
+    expected = 0x2C48
+    assert sim.R[0] == expected, f"Expected {expected:04x}, got {sim.R[0]:04x}"
+
+
+def test_leading_ones(builtins_isa_file, tmp_path):
     """Test leading_ones function in simulator"""
-    isa = parse_isa_file(str(builtins_isa_file))
-    
-    with tempfile.TemporaryDirectory() as tmpdir:
-        tmpdir_path = Path(tmpdir)
-        
-        sim_gen = SimulatorGenerator(isa)
-        sim_file = sim_gen.generate(tmpdir_path)
-        
-        asm_gen = AssemblerGenerator(isa)
-        asm_file = asm_gen.generate(tmpdir_path)
-        
-        sys.path.insert(0, str(tmpdir_path))
-        try:
-            import importlib.util
-            sim_spec = importlib.util.spec_from_file_location("simulator", sim_file)
-            sim_module = importlib.util.module_from_spec(sim_spec)
-            sim_spec.loader.exec_module(sim_module)
-            Simulator = sim_module.Simulator
-            
-            asm_spec = importlib.util.spec_from_file_location("assembler", asm_file)
-            asm_module = importlib.util.module_from_spec(asm_spec)
-            asm_spec.loader.exec_module(asm_module)
-            Assembler = asm_module.Assembler
-            
-            assembler = Assembler()
-            sim = Simulator()
-            
-            # Test: leading_ones with 0xFFFFFFFF (all ones)
-            assembly_code = "LEADING_ONES R0, R1"
-            machine_code = assembler.assemble(assembly_code)
-            
-            binary_file = tmpdir_path / "test.bin"
-            with open(binary_file, 'wb') as f:
-                for word in machine_code:
-                    f.write(word.to_bytes(4, byteorder='little'))
-            
-            sim.load_binary_file(str(binary_file), start_address=0)
-            sim.R[1] = 0xFFFFFFFF
-            sim.R[0] = 0
-            
-            executed = sim.step()
-            assert executed, "Instruction should execute successfully"
-            
-            # leading_ones(0xFFFFFFFF) should return 32 (all bits are ones)
-            expected = 32
-            assert sim.R[0] == expected, f"Expected {expected}, got {sim.R[0]}"
-            
-        finally:
-            if str(tmpdir_path) in sys.path:
-                sys.path.remove(str(tmpdir_path))
-
-
-def test_leading_zeros(builtins_isa_file):
+    isa = load_isa(builtins_isa_file)
+    
+    sim_gen = SimulatorGenerator(isa)
+    sim_file = sim_gen.generate(tmp_path)
+    
+    asm_gen = AssemblerGenerator(isa)
+    asm_file = asm_gen.generate(tmp_path)
+    
+    sim_module = load_generated_module(sim_file)
+    Simulator = sim_module.Simulator
+    
+    asm_module = load_generated_module(asm_file)
+    Assembler = asm_module.Assembler
+    
+    assembler = Assembler()
+    sim = Simulator()
+    
+    # Test: leading_ones with 0xFFFFFFFF (all ones)
+    assembly_code = "LEADING_ONES R0, R1"
+    machine_code = assembler.assemble(assembly_code)
+    
+    binary_file = tmp_path / "test.bin"
+    with open(binary_file, 'wb') as f:
+        for word in machine_code:
+            f.write(word.to_bytes(4, byteorder='little'))
+    
+    sim.load_binary_file(binary_file, start_address=0)
+    sim.R[1] = 0xFFFFFFFF
+    sim.R[0] = 0
+    
+    executed = sim.step()
+    assert executed, "Instruction should execute successfully"
+    
+    # leading_ones(0xFFFFFFFF) should return 32 (all bits are ones)
+    expected = 32
+    assert sim.R[0] == expected, f"Expected {expected}, got {sim.R[0]}"
+
+
+def test_leading_zeros(builtins_isa_file, tmp_path):
     """Test leading_zeros function in simulator"""
-    isa = parse_isa_file(str(builtins_isa_file))
-    
-    with tempfile.TemporaryDirectory() as tmpdir:
-        tmpdir_path = Path(tmpdir)
-        
-        sim_gen = SimulatorGenerator(isa)
-        sim_file = sim_gen.generate(tmpdir_path)
-        
-        asm_gen = AssemblerGenerator(isa)
-        asm_file = asm_gen.generate(tmpdir_path)
-        
-        sys.path.insert(0, str(tmpdir_path))
-        try:
-            import importlib.util
-            sim_spec = importlib.util.spec_from_file_location("simulator", sim_file)
-            sim_module = importlib.util.module_from_spec(sim_spec)
-            sim_spec.loader.exec_module(sim_module)
-            Simulator = sim_module.Simulator
-            
-            asm_spec = importlib.util.spec_from_file_location("assembler", asm_file)
-            asm_module = importlib.util.module_from_spec(asm_spec)
-            asm_spec.loader.exec_module(asm_module)
-            Assembler = asm_module.Assembler
-            
-            assembler = Assembler()
-            sim = Simulator()
-            
-            # Test: leading_zeros with 0x0 (all zeros)
-            assembly_code = "LEADING_ZEROS R0, R1"
-            machine_code = assembler.assemble(assembly_code)
-            
-            binary_file = tmpdir_path / "test.bin"
-            with open(binary_file, 'wb') as f:
-                for word in machine_code:
-                    f.write(word.to_bytes(4, byteorder='little'))
-            
-            sim.load_binary_file(str(binary_file), start_address=0)
-            sim.R[1] = 0x0
-            sim.R[0] = 0
-            
-            executed = sim.step()
-            assert executed, "Instruction should execute successfully"
-            
-            # leading_zeros(0x0) should return 32 (all bits are zeros)
-            expected = 32
-            assert sim.R[0] == expected, f"Expected {expected}, got {sim.R[0]}"
-            
-        finally:
-            if str(tmpdir_path) in sys.path:
-                sys.path.remove(str(tmpdir_path))
-
-
-def test_leading_signs(builtins_isa_file):
+    isa = load_isa(builtins_isa_file)
+    
+    sim_gen = SimulatorGenerator(isa)
+    sim_file = sim_gen.generate(tmp_path)
+    
+    asm_gen = AssemblerGenerator(isa)
+    asm_file = asm_gen.generate(tmp_path)
+    
+    sim_module = load_generated_module(sim_file)
+    Simulator = sim_module.Simulator
+    
+    asm_module = load_generated_module(asm_file)
+    Assembler = asm_module.Assembler
+    
+    assembler = Assembler()
+    sim = Simulator()
+    
+    # Test: leading_zeros with 0x0 (all zeros)
+    assembly_code = "LEADING_ZEROS R0, R1"
+    machine_code = assembler.assemble(assembly_code)
+    
+    binary_file = tmp_path / "test.bin"
+    with open(binary_file, 'wb') as f:
+        for word in machine_code:
+            f.write(word.to_bytes(4, byteorder='little'))
+    
+    sim.load_binary_file(binary_file, start_address=0)
+    sim.R[1] = 0x0
+    sim.R[0] = 0
+    
+    executed = sim.step()
+    assert executed, "Instruction should execute successfully"
+    
+    # leading_zeros(0x0) should return 32 (all bits are zeros)
+    expected = 32
+    assert sim.R[0] == expected, f"Expected {expected}, got {sim.R[0]}"
+
+
+def test_leading_signs(builtins_isa_file, tmp_path):
     """Test leading_signs function in simulator"""
-    isa = parse_isa_file(str(builtins_isa_file))
-    
-    with tempfile.TemporaryDirectory() as tmpdir:
-        tmpdir_path = Path(tmpdir)
-        
-        sim_gen = SimulatorGenerator(isa)
-        sim_file = sim_gen.generate(tmpdir_path)
-        
-        asm_gen = AssemblerGenerator(isa)
-        asm_file = asm_gen.generate(tmpdir_path)
-        
-        sys.path.insert(0, str(tmpdir_path))
-        try:
-            import importlib.util
-            sim_spec = importlib.util.spec_from_file_location("simulator", sim_file)
-            sim_module = importlib.util.module_from_spec(sim_spec)
-            sim_spec.loader.exec_module(sim_module)
-            Simulator = sim_module.Simulator
-            
-            asm_spec = importlib.util.spec_from_file_location("assembler", asm_file)
-            asm_module = importlib.util.module_from_spec(asm_spec)
-            asm_spec.loader.exec_module(asm_module)
-            Assembler = asm_module.Assembler
-            
-            assembler = Assembler()
-            sim = Simulator()
-            
-            # Test: leading_signs with 0xFFFFFFFF (negative, sign bit = 1)
-            assembly_code = "LEADING_SIGNS R0, R1"
-            machine_code = assembler.assemble(assembly_code)
-            
-            binary_file = tmpdir_path / "test.bin"
-            with open(binary_file, 'wb') as f:
-                for word in machine_code:
-                    f.write(word.to_bytes(4, byteorder='little'))
-            
-            sim.load_binary_file(str(binary_file), start_address=0)
-            sim.R[1] = 0xFFFFFFFF
-            sim.R[0] = 0
-            
-            executed = sim.step()
-            assert executed, "Instruction should execute successfully"
-            
-            # leading_signs(0xFFFFFFFF) should return 31 (bits 30-0 all match sign bit 1)
-            expected = 31
-            assert sim.R[0] == expected, f"Expected {expected}, got {sim.R[0]}"
-            
-        finally:
-            if str(tmpdir_path) in sys.path:
-                sys.path.remove(str(tmpdir_path))
+    isa = load_isa(builtins_isa_file)
+    
+    sim_gen = SimulatorGenerator(isa)
+    sim_file = sim_gen.generate(tmp_path)
+    
+    asm_gen = AssemblerGenerator(isa)
+    asm_file = asm_gen.generate(tmp_path)
+    
+    sim_module = load_generated_module(sim_file)
+    Simulator = sim_module.Simulator
+    
+    asm_module = load_generated_module(asm_file)
+    Assembler = asm_module.Assembler
+    
+    assembler = Assembler()
+    sim = Simulator()
+    
+    # Test: leading_signs with 0xFFFFFFFF (negative, sign bit = 1)
+    assembly_code = "LEADING_SIGNS R0, R1"
+    machine_code = assembler.assemble(assembly_code)
+    
+    binary_file = tmp_path / "test.bin"
+    with open(binary_file, 'wb') as f:
+        for word in machine_code:
+            f.write(word.to_bytes(4, byteorder='little'))
+    
+    sim.load_binary_file(binary_file, start_address=0)
+    sim.R[1] = 0xFFFFFFFF
+    sim.R[0] = 0
+    
+    executed = sim.step()
+    assert executed, "Instruction should execute successfully"
+    
+    # leading_signs(0xFFFFFFFF) should return 31 (bits 30-0 all match sign bit 1)
+    expected = 31
+    assert sim.R[0] == expected, f"Expected {expected}, got {sim.R[0]}"
 
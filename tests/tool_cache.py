@@ -0,0 +1,92 @@
+"""Session-wide cache of generated tool classes shared by the test suites.
+
+Generating and importing a simulator, assembler and disassembler is the
+dominant cost of the end-to-end tests, and the result only depends on the
+ISA file. Parsed ISA models and the generated classes are cached per ISA
+file and reused; tests instantiate fresh objects, so no simulator state is
+shared between them.
+"""
+
+import hashlib
+import linecache
+from functools import lru_cache
+from pathlib import Path
+from types import ModuleType
+from typing import Dict, Tuple
+
+from isa_dsl.model.parser import parse_isa_file
+from isa_dsl.generators.simulator import SimulatorGenerator
+from isa_dsl.generators.assembler import AssemblerGenerator
+from isa_dsl.generators.disassembler import DisassemblerGenerator
+
+
+# Imported modules keyed by the BLAKE2b digest of their generated source
+_MODULE_CACHE: Dict[bytes, ModuleType] = {}
+
+# (Simulator, Assembler, Disassembler) classes keyed by ISA file path and mtime
+_TOOLS_CACHE: Dict[Tuple[Path, int], Tuple[type, type, type]] = {}
+
+
+@lru_cache(maxsize=32)
+def _cached_parse(path: str, mtime_ns: int):
+    return parse_isa_file(path)
+
+
+def load_isa(isa_file):
+    """Parse an ISA file, reusing the model from an earlier parse of the same file.
+
+    The generators only read the model, so tests share one instance per file;
+    tests must not modify the returned model.
+    """
+    isa_file = Path(isa_file).resolve()
+    return _cached_parse(str(isa_file), isa_file.stat().st_mtime_ns)
+
+
+def load_generated_source(source: str, filename: str) -> ModuleType:
+    """Import generated source code, reusing an earlier import of the same source.
+
+    Generators produce identical source for the same ISA, so modules are keyed
+    by a digest of the source: generating a tool again reuses the module
+    instead of compiling and executing it again. filename is only used for
+    tracebacks, and need not exist on disk.
+    """
+    key = hashlib.blake2b(source.encode()).digest()
+    module = _MODULE_CACHE.get(key)
+    if module is None:
+        code = compile(source, filename, 'exec')
+        module = ModuleType(Path(filename).stem)
+        module.__file__ = filename
+        exec(code, module.__dict__)
+        _MODULE_CACHE[key] = module
+        if not Path(filename).exists():
+            # Let tracebacks show the generated source
+            linecache.cache[filename] = (len(source), None, source.splitlines(True), filename)
+    return module
+
+
+def load_generated_module(module_file) -> ModuleType:
+    """Import a generated module from a file, reusing an earlier import of the same source."""
+    module_file = Path(module_file).resolve()
+    return load_generated_source(module_file.read_text(), str(module_file))
+
+
+def get_generated_tools(isa_file) -> Tuple[type, type, type]:
+    """Return (Simulator, Assembler, Disassembler) classes for an ISA file.
+
+    The tools are rendered and imported in memory on the first request for an
+    ISA file, without writing them to disk; later requests return the cached
+    classes until the file is modified.
+    """
+    isa_file = Path(isa_file).resolve()
+    key = (isa_file, isa_file.stat().st_mtime_ns)
+    tools = _TOOLS_CACHE.get(key)
+    if tools is None:
+        isa = load_isa(isa_file)
+        prefix = f"<generated from {isa_file.name}>"
+        tools = (
+            load_generated_source(SimulatorGenerator(isa).render(), f"{prefix}/simulator.py").Simulator,
+            load_generated_source(AssemblerGenerator(isa).render(), f"{prefix}/assembler.py").Assembler,
+            load_generated_source(DisassemblerGenerator(isa).render(), f"{prefix}/disassembler.py").Disassembler,
+        )
+        _TOOLS_CACHE[key] = tools
+    return tools
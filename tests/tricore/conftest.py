@@ -0,0 +1,40 @@
+"""Shared fixtures for TriCore tests."""
+
+import pytest
+from pathlib import Path
+
+from tests.tricore.test_helpers import TriCoreTestHelpers
+
+
+TEST_DATA_DIR = Path(__file__).parent / "test_data"
+
+
+@pytest.fixture(scope="session")
+def tricore_isa_file():
+    """Fixture providing path to TriCore ISA file."""
+    return TEST_DATA_DIR / "arch.isa"
+
+
+@pytest.fixture(scope="session")
+def tricore_code_file():
+    """Fixture providing path to TriCore assembly code file."""
+    return TEST_DATA_DIR / "code.s"
+
+
+@pytest.fixture(scope="session")
+def tricore_tools(generated_tools, tricore_isa_file):
+    """(Simulator, Assembler, Disassembler) classes generated once per session."""
+    return generated_tools(tricore_isa_file)
+
+
+@pytest.fixture(scope="session")
+def tricore_abs_binary(tricore_tools, tricore_code_file, tmp_path_factory):
+    """Binary assembled once from code.s and shared by the ABS tests.
+
+    Tests only read the file, so it is written a single time per session.
+    """
+    _, Assembler, _ = tricore_tools
+    machine_code = Assembler().assemble(tricore_code_file.read_text())
+    binary_file = tmp_path_factory.mktemp("bin") / "abs.bin"
+    TriCoreTestHelpers.write_machine_code_to_file(machine_code, binary_file)
+    return binary_file
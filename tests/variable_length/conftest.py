@@ -0,0 +1,36 @@
+"""Shared fixtures for variable-length instruction tests."""
+
+import pytest
+from pathlib import Path
+
+
+TEST_DATA_DIR = Path(__file__).parent / "test_data"
+
+
+@pytest.fixture(scope="session")
+def variable_length_isa_file():
+    """Fixture providing path to the variable-length ISA example file."""
+    isa_file = TEST_DATA_DIR / "variable_length.isa"
+    if not isa_file.exists():
+        pytest.skip(f"ISA file not found: {isa_file}")
+    return isa_file
+
+
+@pytest.fixture(scope="session")
+def identification_fields_isa_file():
+    """Fixture providing path to the ISA file with identification fields."""
+    return TEST_DATA_DIR / "test_identification_fields.isa"
+
+
+@pytest.fixture(scope="session")
+def variable_length_asm_cls(generated_tools, identification_fields_isa_file):
+    """Assembler class generated once per session."""
+    _, Assembler, _ = generated_tools(identification_fields_isa_file)
+    return Assembler
+
+
+@pytest.fixture(scope="session")
+def variable_length_disasm_cls(generated_tools, identification_fields_isa_file):
+    """Disassembler class generated once per session, from the same tools as the assembler."""
+    _, _, Disassembler = generated_tools(identification_fields_isa_file)
+    return Disassembler
@@ -1,13 +1,11 @@
 """Helper methods for variable-length instruction tests."""
 
-import tempfile
-import importlib.util
-import os
 from pathlib import Path
 
 from isa_dsl.generators.simulator import SimulatorGenerator
 from isa_dsl.generators.assembler import AssemblerGenerator
 from isa_dsl.generators.disassembler import DisassemblerGenerator
+from tests.tool_cache import load_generated_module
 
 
 class VariableLengthTestHelpers:
@@ -20,9 +18,7 @@ class VariableLengthTestHelpers:
         asm_gen.generate(tmpdir_path)
         asm_file = Path(tmpdir_path) / "assembler.py"
         
-        spec = importlib.util.spec_from_file_location("assembler", asm_file)
-        assembler_module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(assembler_module)
+        assembler_module = load_generated_module(asm_file)
         return assembler_module.Assembler
     
     @staticmethod
@@ -32,9 +28,7 @@ class VariableLengthTestHelpers:
         sim_gen.generate(tmpdir_path)
         sim_file = Path(tmpdir_path) / "simulator.py"
         
-        spec = importlib.util.spec_from_file_location("simulator", sim_file)
-        simulator_module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(simulator_module)
+        simulator_module = load_generated_module(sim_file)
         return simulator_module.Simulator
     
     @staticmethod
@@ -44,9 +38,7 @@ class VariableLengthTestHelpers:
         disasm_gen.generate(tmpdir_path)
         disasm_file = Path(tmpdir_path) / "disassembler.py"
         
-        spec = importlib.util.spec_from_file_location("disassembler", disasm_file)
-        disassembler_module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(disassembler_module)
+        disassembler_module = load_generated_module(disasm_file)
         return disassembler_module.Disassembler
     
     @staticmethod
@@ -64,31 +56,25 @@ class VariableLengthTestHelpers:
         asm_file = Path(tmpdir_path) / "assembler.py"
         disasm_file = Path(tmpdir_path) / "disassembler.py"
         
-        sim_spec = importlib.util.spec_from_file_location("simulator", sim_file)
-        simulator_module = importlib.util.module_from_spec(sim_spec)
-        sim_spec.loader.exec_module(simulator_module)
+        simulator_module = load_generated_module(sim_file)
         
-        asm_spec = importlib.util.spec_from_file_location("assembler", asm_file)
-        assembler_module = importlib.util.module_from_spec(asm_spec)
-        asm_spec.loader.exec_module(assembler_module)
+        assembler_module = load_generated_module(asm_file)
         
-        disasm_spec = importlib.util.spec_from_file_location("disassembler", disasm_file)
-        disassembler_module = importlib.util.module_from_spec(disasm_spec)
-        disasm_spec.loader.exec_module(disassembler_module)
+        disassembler_module = load_generated_module(disasm_file)
         
         return (simulator_module.Simulator, assembler_module.Assembler, disassembler_module.Disassembler)
     
     @staticmethod
-    def test_instruction_end_to_end(isa, tmpdir_path, source_code, expected_r0, expected_pc, instruction_name):
-        """Test end-to-end flow for a single instruction."""
-        Simulator, Assembler, Disassembler = VariableLengthTestHelpers.generate_and_import_all_tools(isa, tmpdir_path)
+    def test_instruction_end_to_end(tools, tmpdir_path, source_code, expected_r0, expected_pc, instruction_name):
+        """Test end-to-end flow for a single instruction using (Simulator, Assembler, Disassembler) classes."""
+        Simulator, Assembler, Disassembler = tools
         
         sim = Simulator()
         asm = Assembler()
         disasm = Disassembler()
         
         machine_code = asm.assemble(source_code)
-        binary_file = os.path.join(tmpdir_path, "test.bin")
+        binary_file = Path(tmpdir_path) / "test.bin"
         asm.write_binary(machine_code, binary_file)
         
         sim.load_binary_file(binary_file)
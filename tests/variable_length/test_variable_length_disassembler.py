@@ -1,179 +1,85 @@
 """Tests for variable-length instruction disassembly."""
 
 import pytest
-from pathlib import Path
-import tempfile
-import os
-import importlib.util
-from isa_dsl.model.parser import parse_isa_file
-from isa_dsl.generators.disassembler import DisassemblerGenerator
-from tests.variable_length.test_helpers import VariableLengthTestHelpers
+import struct
 
 
-@pytest.fixture
-def variable_length_isa_file():
-    """Create a test ISA file with variable-length instructions."""
-    project_root = Path(__file__).parent.parent
-    return Path(__file__).parent / "test_data" / "test_identification_fields.isa"
+pytestmark = pytest.mark.xdist_group("varlen_identification_fields")
 
 
-def test_disassembler_identifies_instruction_width(variable_length_isa_file):
+# ADD16 R0, R1, 5 in SHORT_16: opcode=1 [0:5], rd=0 [6:8], rs1=1 [9:11], immediate=5 [12:15]
+ADD16_R0_R1_5 = (1 << 0) | (0 << 6) | (1 << 9) | (5 << 12)  # = 0x5201
+# ADD32 R3, R1, R2 in LONG_32: opcode=2 [0:6], funct=0 [7:10], rd=3 [11:15], rs1=1 [16:20], rs2=2 [21:25]
+ADD32_R3_R1_R2 = (2 << 0) | (0 << 7) | (3 << 11) | (1 << 16) | (2 << 21)
+
+
+@pytest.mark.parametrize("word,expected_width", [
+    (ADD16_R0_R1_5, 16),
+    (ADD32_R3_R1_R2, 32),
+], ids=["ADD16", "ADD32"])
+def test_disassembler_identifies_instruction_width(variable_length_disasm_cls, word, expected_width):
     """Test that disassembler correctly identifies instruction width."""
-    isa = parse_isa_file(str(variable_length_isa_file))
+    disasm = variable_length_disasm_cls()
     
-    # Generate disassembler
-    disasm_gen = DisassemblerGenerator(isa)
-    with tempfile.TemporaryDirectory() as tmpdir:
-        disasm_gen.generate(tmpdir)
-        disasm_file = Path(tmpdir) / "disassembler.py"
-        
-        # Import generated disassembler
-        spec = importlib.util.spec_from_file_location("disassembler", disasm_file)
-        disassembler_module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(disassembler_module)
-        Disassembler = disassembler_module.Disassembler
-        
-        # Create disassembler instance
-        disasm = Disassembler()
-        
-        # Test width identification
-        # Note: Width identification may default to 32 bits if matching conditions
-        # aren't generated correctly, but disassembly should still work via disassemble()
-        # 16-bit instruction: ADD16 (opcode=1)
-        add16_word = (1 << 0) | (0 << 6) | (1 << 9) | (5 << 12)  # = 0x5201
-        width_16 = disasm._identify_instruction_width(add16_word)
-        # Width identification may not work perfectly, but disassembly should work
-        # The key test is that disassemble() can handle variable-length instructions
+    width = disasm._identify_instruction_width(word)
+    assert width == expected_width, f"Expected {expected_width}-bit instruction, got {width}"
 
 
-def test_disassembler_disassembles_variable_length_instructions(variable_length_isa_file):
+@pytest.mark.parametrize("word,num_bits,mnemonic", [
+    # ADD16 is matched by its identification field (opcode) alone, at the identified width
+    (ADD16_R0_R1_5, None, "ADD16"),
+    (ADD32_R3_R1_R2, 32, "ADD32"),
+], ids=["ADD16", "ADD32"])
+def test_disassembler_disassembles_variable_length_instructions(variable_length_disasm_cls, word, num_bits, mnemonic):
     """Test that disassembler correctly disassembles variable-length instructions."""
-    isa = parse_isa_file(str(variable_length_isa_file))
+    disasm = variable_length_disasm_cls()
     
-    # Generate disassembler
-    disasm_gen = DisassemblerGenerator(isa)
-    with tempfile.TemporaryDirectory() as tmpdir:
-        disasm_gen.generate(tmpdir)
-        disasm_file = Path(tmpdir) / "disassembler.py"
-        
-        # Import generated disassembler
-        spec = importlib.util.spec_from_file_location("disassembler", disasm_file)
-        disassembler_module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(disassembler_module)
-        Disassembler = disassembler_module.Disassembler
-        
-        # Create disassembler instance
-        disasm = Disassembler()
-        
-        # Test 16-bit instruction disassembly
-        add16_word = (1 << 0) | (0 << 6) | (1 << 9) | (5 << 12)  # ADD16 R0, R1, 5
-        result_16 = disasm.disassemble(add16_word)
-        assert result_16 is not None, "16-bit instruction should disassemble"
-        assert "ADD16" in result_16.upper(), f"Expected ADD16 in result, got {result_16}"
-        
-        # Test 32-bit instruction disassembly
-        # Note: The core functionality is that disassemble() can handle variable-length instructions
-        # The exact matching may need refinement, but the structure supports it
-        add32_word = (2 << 0) | (0 << 7) | (3 << 11) | (1 << 16) | (2 << 21)  # ADD32 R3, R1, R2
-        result_32 = disasm.disassemble(add32_word, num_bits=32)  # Explicitly specify width
-        # Verify that disassembly works (may match ADD32 or another instruction)
-        assert result_32 is not None, "32-bit instruction should disassemble"
-        # The key test is that variable-length disassembly infrastructure works
+    result = disasm.disassemble(word, num_bits)
+    assert result is not None, f"{mnemonic} instruction should disassemble"
+    assert mnemonic in result.upper(), f"Expected {mnemonic} in result, got {result}"
 
 
-def test_disassembler_file_with_variable_length(variable_length_isa_file):
+def test_disassembler_file_with_variable_length(variable_length_asm_cls, variable_length_disasm_cls, tmp_path):
     """Test that disassembler correctly handles variable-length instructions in binary files."""
-    isa = parse_isa_file(str(variable_length_isa_file))
+    asm = variable_length_asm_cls()
+    disasm = variable_length_disasm_cls()
     
-    with tempfile.TemporaryDirectory() as tmpdir:
-        Assembler = VariableLengthTestHelpers.generate_and_import_assembler(isa, tmpdir)
-        Disassembler = VariableLengthTestHelpers.generate_and_import_disassembler(isa, tmpdir)
-        
-        asm = Assembler()
-        disasm = Disassembler()
-        
-        source = "ADD16 R0, R1, 5\nADD32 R2, R3, R4"
-        machine_code = asm.assemble(source)
-        binary_file = os.path.join(tmpdir, "test.bin")
-        asm.write_binary(machine_code, binary_file)
-        
-        instructions = disasm.disassemble_file(binary_file, start_address=0)
-        assert len(instructions) >= 2, f"Expected at least 2 instructions, got {len(instructions)}"
-        
-        asm_texts = [asm_str.upper() for _, asm_str in instructions]
-        assert any("ADD16" in text or "ADD32" in text for text in asm_texts), \
-            f"Expected to find ADD16 or ADD32, got {asm_texts}"
-
-
-def test_disassembler_uses_identification_fields(variable_length_isa_file):
-    """Test that disassembler uses identification fields for matching."""
-    isa = parse_isa_file(str(variable_length_isa_file))
+    source = "ADD16 R0, R1, 5\nADD32 R2, R3, R4"
+    machine_code = asm.assemble(source)
+    binary_file = tmp_path / "test.bin"
+    asm.write_binary(machine_code, binary_file)
+    
+    instructions = disasm.disassemble_file(binary_file, start_address=0)
+    assert len(instructions) >= 2, f"Expected at least 2 instructions, got {len(instructions)}"
+    assert disasm.disassemble_bytes(asm.to_bytes(machine_code)) == instructions, \
+        "disassemble_bytes() should match disassemble_file() on the same image"
     
-    # Generate disassembler
-    disasm_gen = DisassemblerGenerator(isa)
-    with tempfile.TemporaryDirectory() as tmpdir:
-        disasm_gen.generate(tmpdir)
-        disasm_file = Path(tmpdir) / "disassembler.py"
-        
-        # Import generated disassembler
-        spec = importlib.util.spec_from_file_location("disassembler", disasm_file)
-        disassembler_module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(disassembler_module)
-        Disassembler = disassembler_module.Disassembler
-        
-        # Create disassembler instance
-        disasm = Disassembler()
-        
-        # Test that identification fields are used (not all encoding fields)
-        # ADD16 uses opcode as identification field
-        add16_word = (1 << 0) | (0 << 6) | (1 << 9) | (5 << 12)  # opcode=1
-        result = disasm.disassemble(add16_word)
-        assert result is not None, "Should match using identification field (opcode)"
-        assert "ADD16" in result.upper(), f"Expected ADD16, got {result}"
+    asm_texts = [asm_str.upper() for _, asm_str in instructions]
+    assert any("ADD16" in text or "ADD32" in text for text in asm_texts), \
+        f"Expected to find ADD16 or ADD32, got {asm_texts}"
 
 
-def test_disassembler_handles_word_boundaries(variable_length_isa_file):
+def test_disassembler_handles_word_boundaries(variable_length_disasm_cls, tmp_path):
     """Test that disassembler correctly handles instructions spanning word boundaries."""
-    isa = parse_isa_file(str(variable_length_isa_file))
+    disasm = variable_length_disasm_cls()
+    
+    # Create a binary file with mixed-length instructions
+    binary_file = tmp_path / "test.bin"
+    # 16-bit instruction (2 bytes), then a 32-bit instruction (4 bytes) starting at byte 2
+    binary_file.write_bytes(struct.pack('<HI', ADD16_R0_R1_5, ADD32_R3_R1_R2))
+    
+    # Disassemble file
+    instructions = disasm.disassemble_file(binary_file, start_address=0)
+    
+    # Verify that disassembly works with variable-length instructions
+    # The key test is that disassemble_file can handle mixed instruction widths
+    assert len(instructions) > 0, f"Expected at least 1 instruction, got {len(instructions)}"
+    
+    # First instruction should be at address 0
+    assert instructions[0][0] == 0, f"First instruction should be at address 0, got {instructions[0][0]}"
     
-    # Generate disassembler
-    disasm_gen = DisassemblerGenerator(isa)
-    with tempfile.TemporaryDirectory() as tmpdir:
-        disasm_gen.generate(tmpdir)
-        disasm_file = Path(tmpdir) / "disassembler.py"
-        
-        # Import generated disassembler
-        spec = importlib.util.spec_from_file_location("disassembler", disasm_file)
-        disassembler_module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(disassembler_module)
-        Disassembler = disassembler_module.Disassembler
-        
-        # Create disassembler instance
-        disasm = Disassembler()
-        
-        # Create a binary file with mixed-length instructions
-        binary_file = os.path.join(tmpdir, "test.bin")
-        with open(binary_file, 'wb') as f:
-            # Write 16-bit instruction (2 bytes)
-            add16_word = (1 << 0) | (0 << 6) | (1 << 9) | (5 << 12)
-            f.write(add16_word.to_bytes(2, byteorder='little'))
-            
-            # Write 32-bit instruction (4 bytes) starting at byte 2
-            add32_word = (2 << 0) | (0 << 7) | (3 << 11) | (1 << 16) | (2 << 21)
-            f.write(add32_word.to_bytes(4, byteorder='little'))
-        
-        # Disassemble file
-        instructions = disasm.disassemble_file(binary_file, start_address=0)
-        
-        # Verify that disassembly works with variable-length instructions
-        # The key test is that disassemble_file can handle mixed instruction widths
-        assert len(instructions) > 0, f"Expected at least 1 instruction, got {len(instructions)}"
-        
-        # First instruction should be at address 0
-        assert instructions[0][0] == 0, f"First instruction should be at address 0, got {instructions[0][0]}"
-        
-        # If we have multiple instructions, verify address progression
-        if len(instructions) >= 2:
-            # Second instruction should be at address 2 (after 16-bit instruction)
-            assert instructions[1][0] == 2, f"Second instruction should be at address 2, got {instructions[1][0]}"
+    # If we have multiple instructions, verify address progression
+    if len(instructions) >= 2:
+        # Second instruction should be at address 2 (after 16-bit instruction)
+        assert instructions[1][0] == 2, f"Second instruction should be at address 2, got {instructions[1][0]}"
 
@@ -1,170 +1,117 @@
 """Tests for variable-length instruction execution in simulator."""
 
 import pytest
-from pathlib import Path
-import tempfile
-import importlib.util
-from isa_dsl.model.parser import parse_isa_file
-from isa_dsl.generators.simulator import SimulatorGenerator
-from isa_dsl.generators.assembler import AssemblerGenerator
 
 
-@pytest.fixture
-def variable_length_isa_file():
-    """Create a test ISA file with variable-length instructions."""
-    project_root = Path(__file__).parent.parent
-    return Path(__file__).parent / "test_data" / "test_identification_fields.isa"
+pytestmark = pytest.mark.xdist_group("varlen_identification_fields")
 
 
-def test_variable_length_instruction_execution(variable_length_isa_file):
+def test_variable_length_instruction_execution(identification_fields_isa_file, generated_tools):
     """Test that variable-length instructions execute correctly."""
-    isa = parse_isa_file(str(variable_length_isa_file))
-    
-    # Generate simulator
-    sim_gen = SimulatorGenerator(isa)
-    with tempfile.TemporaryDirectory() as tmpdir:
-        sim_gen.generate(tmpdir)
-        sim_file = Path(tmpdir) / "simulator.py"
-        
-        # Import generated simulator
-        spec = importlib.util.spec_from_file_location("simulator", sim_file)
-        simulator_module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(simulator_module)
-        Simulator = simulator_module.Simulator
-        
-        # Create simulator instance
-        sim = Simulator()
-        
-        # Test 16-bit instruction (ADD16: opcode=1, rd=0, rs1=1, immediate=5)
-        # Encoding: opcode[0:5]=1, rd[6:8]=0, rs1[9:11]=1, immediate[12:15]=5
-        # Binary layout: [15:12]=5, [11:9]=1, [8:6]=0, [5:0]=1
-        # = 0101 001 000 000001 = 0x5281 (but in little-endian 16-bit, this is stored as 0x8152)
-        # Actually, let's build it correctly:
-        # opcode=1 at bits [0:5] = 0x0001
-        # rd=0 at bits [6:8] = 0x0000
-        # rs1=1 at bits [9:11] = 0x0200
-        # immediate=5 at bits [12:15] = 0x5000
-        # Total = 0x5201
-        instruction_word = (1 << 0) | (0 << 6) | (1 << 9) | (5 << 12)  # = 0x5201
-        sim.memory[0x0000] = instruction_word & 0xFFFF  # Store as 16-bit value in 32-bit word
-        sim.pc = 0x0000
-        
-        # Initialize registers
-        sim.R[1] = 10
-        
-        # Execute
-        result = sim.step()
-        
-        assert result is True, "Step should succeed"
-        assert sim.R[0] == 15, f"Expected R[0]=15 (10+5), got {sim.R[0]}"
-        assert sim.pc == 0x0002, f"Expected PC=0x0002 (16 bits = 2 bytes), got 0x{sim.pc:08x}"
+    Simulator, _, _ = generated_tools(identification_fields_isa_file)
+    
+    # Create simulator instance
+    sim = Simulator()
+    
+    # Test 16-bit instruction (ADD16: opcode=1, rd=0, rs1=1, immediate=5)
+    # Encoding: opcode[0:5]=1, rd[6:8]=0, rs1[9:11]=1, immediate[12:15]=5
+    # Binary layout: [15:12]=5, [11:9]=1, [8:6]=0, [5:0]=1
+    # = 0101 001 000 000001 = 0x5281 (but in little-endian 16-bit, this is stored as 0x8152)
+    # Actually, let's build it correctly:
+    # opcode=1 at bits [0:5] = 0x0001
+    # rd=0 at bits [6:8] = 0x0000
+    # rs1=1 at bits [9:11] = 0x0200
+    # immediate=5 at bits [12:15] = 0x5000
+    # Total = 0x5201
+    instruction_word = (1 << 0) | (0 << 6) | (1 << 9) | (5 << 12)  # = 0x5201
+    sim.memory[0x0000] = instruction_word & 0xFFFF  # Store as 16-bit value in 32-bit word
+    sim.pc = 0x0000
+    
+    # The first byte alone should point the fetch at the 16-bit format first
+    assert sim._LEN_TABLE[instruction_word & 0xFF][0] == 16, \
+        f"Expected 16-bit width first for byte 0x{instruction_word & 0xFF:02x}"
+    
+    # Initialize registers
+    sim.R[1] = 10
+    
+    # Execute
+    result = sim.step()
+    
+    assert result is True, "Step should succeed"
+    assert sim.R[0] == 15, f"Expected R[0]=15 (10+5), got {sim.R[0]}"
+    assert sim.pc == 0x0002, f"Expected PC=0x0002 (16 bits = 2 bytes), got 0x{sim.pc:08x}"
 
 
-def test_mixed_length_instructions(variable_length_isa_file):
+def test_mixed_length_instructions(identification_fields_isa_file, generated_tools):
     """Test execution of mixed 16-bit and 32-bit instructions."""
-    isa = parse_isa_file(str(variable_length_isa_file))
-    
-    # Generate simulator
-    sim_gen = SimulatorGenerator(isa)
-    with tempfile.TemporaryDirectory() as tmpdir:
-        sim_gen.generate(tmpdir)
-        sim_file = Path(tmpdir) / "simulator.py"
-        
-        # Import generated simulator
-        spec = importlib.util.spec_from_file_location("simulator", sim_file)
-        simulator_module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(simulator_module)
-        Simulator = simulator_module.Simulator
-        
-        # Create simulator instance
-        sim = Simulator()
-        
-        # Initialize registers
-        sim.R[1] = 5
-        sim.R[2] = 10
-        
-        # Memory layout:
-        # 0x0000: 16-bit ADD16 (opcode=1, rd=0, rs1=1, immediate=3)
-        add16_word = (1 << 0) | (0 << 6) | (1 << 9) | (3 << 12)
-        sim.memory[0x0000] = add16_word & 0xFFFF
-        
-        sim.pc = 0x0000
-        
-        # Execute first instruction (16-bit)
-        result1 = sim.step()
-        assert result1 is True
-        assert sim.R[0] == 8, f"Expected R[0]=8 (5+3), got {sim.R[0]}"
-        assert sim.pc == 0x0002, f"Expected PC=0x0002, got 0x{sim.pc:08x}"
-        
-        # Test that PC correctly advanced by 2 bytes (16 bits) for 16-bit instruction
-        # This verifies variable-length PC updates work correctly
+    Simulator, _, _ = generated_tools(identification_fields_isa_file)
+    
+    # Create simulator instance
+    sim = Simulator()
+    
+    # Initialize registers
+    sim.R[1] = 5
+    sim.R[2] = 10
+    
+    # Memory layout:
+    # 0x0000: 16-bit ADD16 (opcode=1, rd=0, rs1=1, immediate=3)
+    add16_word = (1 << 0) | (0 << 6) | (1 << 9) | (3 << 12)
+    sim.memory[0x0000] = add16_word & 0xFFFF
+    
+    sim.pc = 0x0000
+    
+    # Execute first instruction (16-bit)
+    result1 = sim.step()
+    assert result1 is True
+    assert sim.R[0] == 8, f"Expected R[0]=8 (5+3), got {sim.R[0]}"
+    assert sim.pc == 0x0002, f"Expected PC=0x0002, got 0x{sim.pc:08x}"
+    
+    # Test that PC correctly advanced by 2 bytes (16 bits) for 16-bit instruction
+    # This verifies variable-length PC updates work correctly
 
 
-def test_instruction_spanning_word_boundary(variable_length_isa_file):
+def test_instruction_spanning_word_boundary(identification_fields_isa_file, generated_tools):
     """Test that instructions spanning word boundaries load correctly."""
-    isa = parse_isa_file(str(variable_length_isa_file))
-    
-    # Generate simulator
-    sim_gen = SimulatorGenerator(isa)
-    with tempfile.TemporaryDirectory() as tmpdir:
-        sim_gen.generate(tmpdir)
-        sim_file = Path(tmpdir) / "simulator.py"
-        
-        # Import generated simulator
-        spec = importlib.util.spec_from_file_location("simulator", sim_file)
-        simulator_module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(simulator_module)
-        Simulator = simulator_module.Simulator
-        
-        # Create simulator instance
-        sim = Simulator()
-        
-        # Test _load_bits() directly
-        # Set up memory: word at 0x0000 = 0x12345678, word at 0x0004 = 0xABCDEF00
-        sim.memory[0x0000] = 0x12345678
-        sim.memory[0x0004] = 0xABCDEF00
-        
-        # Load 40 bits starting at byte 2 (should span both words)
-        # Memory[0x0000] = 0x12345678, Memory[0x0004] = 0xABCDEF00
-        # Address 2: byte 2 of word 0 = (0x12345678 >> 16) & 0xFF = 0x34
-        # Address 3: byte 3 of word 0 = (0x12345678 >> 24) & 0xFF = 0x12
-        # Address 4: byte 0 of word 4 = (0xABCDEF00 >> 0) & 0xFF = 0x00
-        # Address 5: byte 1 of word 4 = (0xABCDEF00 >> 8) & 0xFF = 0xEF
-        # Address 6: byte 2 of word 4 = (0xABCDEF00 >> 16) & 0xFF = 0xCD
-        # Value (little-endian): 0x34 | (0x12 << 8) | (0x00 << 16) | (0xEF << 24) | (0xCD << 32)
-        # = 0xCDEF001234
-        result = sim._load_bits(0x0002, 40)
-        expected = 0xCDEF001234 & ((1 << 40) - 1)  # Mask to 40 bits
-        assert result == expected, f"Expected 0x{expected:x}, got 0x{result:x}"
+    Simulator, _, _ = generated_tools(identification_fields_isa_file)
+    
+    # Create simulator instance
+    sim = Simulator()
+    
+    # Test _load_bits() directly
+    # Set up memory: word at 0x0000 = 0x12345678, word at 0x0004 = 0xABCDEF00
+    sim.memory[0x0000] = 0x12345678
+    sim.memory[0x0004] = 0xABCDEF00
+    
+    # Load 40 bits starting at byte 2 (should span both words)
+    # Memory[0x0000] = 0x12345678, Memory[0x0004] = 0xABCDEF00
+    # Address 2: byte 2 of word 0 = (0x12345678 >> 16) & 0xFF = 0x34
+    # Address 3: byte 3 of word 0 = (0x12345678 >> 24) & 0xFF = 0x12
+    # Address 4: byte 0 of word 4 = (0xABCDEF00 >> 0) & 0xFF = 0x00
+    # Address 5: byte 1 of word 4 = (0xABCDEF00 >> 8) & 0xFF = 0xEF
+    # Address 6: byte 2 of word 4 = (0xABCDEF00 >> 16) & 0xFF = 0xCD
+    # Value (little-endian): 0x34 | (0x12 << 8) | (0x00 << 16) | (0xEF << 24) | (0xCD << 32)
+    # = 0xCDEF001234
+    result = sim._load_bits(0x0002, 40)
+    expected = 0xCDEF001234 & ((1 << 40) - 1)  # Mask to 40 bits
+    assert result == expected, f"Expected 0x{expected:x}, got 0x{result:x}"
 
 
-def test_pc_update_for_different_widths(variable_length_isa_file):
+def test_pc_update_for_different_widths(identification_fields_isa_file, generated_tools):
     """Test that PC updates correctly for different instruction widths."""
-    isa = parse_isa_file(str(variable_length_isa_file))
-    
-    # Generate simulator
-    sim_gen = SimulatorGenerator(isa)
-    with tempfile.TemporaryDirectory() as tmpdir:
-        sim_gen.generate(tmpdir)
-        sim_file = Path(tmpdir) / "simulator.py"
-        
-        # Import generated simulator
-        spec = importlib.util.spec_from_file_location("simulator", sim_file)
-        simulator_module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(simulator_module)
-        Simulator = simulator_module.Simulator
-        
-        # Create simulator instance
-        sim = Simulator()
-        
-        # Test 16-bit instruction (ADD16: opcode=1, rd=0, rs1=1, immediate=5)
-        add16_word = (1 << 0) | (0 << 6) | (1 << 9) | (5 << 12)  # = 0x5201
-        sim.memory[0x0000] = add16_word & 0xFFFF
-        sim.pc = 0x0000
-        sim.step()
-        assert sim.pc == 0x0002, f"16-bit instruction: Expected PC=0x0002, got 0x{sim.pc:08x}"
-        
-        # Test that PC updates correctly for 16-bit instruction
-        # This verifies the core Phase 3 functionality: PC updates based on instruction width
-        # The 16-bit instruction test above already verified this works correctly
+    Simulator, _, _ = generated_tools(identification_fields_isa_file)
+    
+    # Create simulator instance
+    sim = Simulator()
+    
+    # Test 16-bit instruction (ADD16: opcode=1, rd=0, rs1=1, immediate=5)
+    add16_word = (1 << 0) | (0 << 6) | (1 << 9) | (5 << 12)  # = 0x5201
+    sim.memory[0x0000] = add16_word & 0xFFFF
+    sim.pc = 0x0000
+    steps = sim.run_until(0x0002, max_steps=4)
+    assert steps == 1, f"Expected one instruction before PC=0x0002, executed {steps}"
+    assert sim.pc == 0x0002, f"16-bit instruction: Expected PC=0x0002, got 0x{sim.pc:08x}"
+    
+    # Test that PC updates correctly for 16-bit instruction
+    # This verifies the core Phase 3 functionality: PC updates based on instruction width
+    # The 16-bit instruction test above already verified this works correctly
 